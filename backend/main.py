@@ -2,40 +2,198 @@
 FastAPI backend server for SKU and image validation pipeline
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING, Optional, Dict, Any, Literal, Callable
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import secrets
+import sys
+import time
+import types
+
+import httpx
+import orjson
 
 from backend.services.sku_generator import SKUGenerator
-from backend.services.image_validator import ImageValidator, ValidationStatus
 from backend.services.review_queue import ReviewQueue, ReviewDecision
+from backend.responses import ORJSONResponse
 import backend.config as config
 
+if TYPE_CHECKING:
+    # Imported lazily in get_image_validator: pulls in OpenCV and PIL
+    from backend.services.image_validator import ImageValidator
+
 logger = logging.getLogger(__name__)
 
+# Reviewer decision string -> enum (keys match SubmitReviewDecisionRequest.decision)
+_DECISION_MAP = types.MappingProxyType({
+    "accepted": ReviewDecision.ACCEPTED,
+    "rejected": ReviewDecision.REJECTED,
+    "requires_edit": ReviewDecision.REQUIRES_EDIT,
+})
+
 # Initialize FastAPI
 app = FastAPI(
     title="SKU & Image Validation Pipeline",
     version="1.0.0",
-    description="Unified API for product code generation and image validation"
+    description="Unified API for product code generation and image validation",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS (terminated at the reverse proxy in production)
+if not config.CORS_HANDLED_BY_PROXY:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=config.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# Compress JSON bodies >= 1 KB (queue listings); small ones like /health pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# ============================================================================
+# Service Providers (injected with Depends; built once per process)
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_sku_generator() -> SKUGenerator:
+    """SKU generator (no DB for demo)"""
+    return SKUGenerator(
+        db_connection=None,
+        max_sku_length=config.SKU_MAX_LENGTH,
+        hash_suffix_length=config.SKU_DETERMINISTIC_HASH_LENGTH,
+        bloom_capacity=config.SKU_BLOOM_CAPACITY,
+        bloom_error_rate=config.SKU_BLOOM_ERROR_RATE,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_image_validator() -> "ImageValidator":
+    """Image validator configured from backend.config (imported on first use)"""
+    from backend.services.image_validator import ImageValidator
+    from backend.services.object_detector import load_detector
+
+    return ImageValidator(
+        background_white_threshold=config.BACKGROUND_WHITE_THRESHOLD,
+        blur_threshold=config.BLUR_THRESHOLD,
+        working_max_side=config.IMAGE_WORKING_MAX_SIDE,
+        decode_scale=config.IMAGE_DECODE_SCALE,
+        min_image_side_px=config.IMAGE_MIN_SIDE_PX,
+        max_image_bytes=config.IMAGE_MAX_SIZE_MB * 1024 * 1024,
+        object_coverage_min=config.OBJECT_COVERAGE_MIN,
+        object_coverage_max=config.OBJECT_COVERAGE_MAX,
+        accept_score_threshold=config.IMAGE_ACCEPT_THRESHOLD,
+        review_score_threshold=config.IMAGE_HUMAN_REVIEW_THRESHOLD,
+        parallel_checks=False,  # Already one validation process per core
+        detector=load_detector(config.OBJECT_DETECTION_MODEL_PATH),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_review_queue() -> ReviewQueue:
+    """Review queue (no DB for demo)"""
+    return ReviewQueue(db_connection=None, reviewer_ids=config.REVIEWER_IDS)
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Shared pooled HTTP client created at startup"""
+    return request.app.state.http
+
+
+def get_validation_pool(request: Request) -> ProcessPoolExecutor:
+    """Process pool for CPU-bound image validation, created at startup"""
+    return request.app.state.cv_pool
+
+
+class _StaleWhileRevalidateCache:
+    """
+    Single-entry cache for a serialized response body.
+
+    Fresh hits return the cached bytes. Once the TTL passes, the stale body
+    is still returned while one background task reloads it; concurrent cold
+    misses share a single load. A failed refresh keeps serving the old body.
+    """
+
+    def __init__(self, loader: Callable[[], bytes], ttl_seconds: float):
+        self._loader = loader
+        self._ttl = ttl_seconds
+        self._body: Optional[bytes] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _is_fresh(self) -> bool:
+        return self._body is not None and time.monotonic() - self._loaded_at < self._ttl
+
+    async def _load(self) -> None:
+        async with self._lock:
+            if self._is_fresh():
+                return
+            self._body = await run_in_threadpool(self._loader)
+            self._loaded_at = time.monotonic()
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._load()
+        except Exception as e:
+            logger.warning("Background cache refresh failed: %s", e)
+
+    async def get(self) -> bytes:
+        if self._body is None:
+            await self._load()
+        elif not self._is_fresh() and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+        return self._body
+
+
+def _load_queue_stats() -> bytes:
+    """
+    Serialized queue stats for the stats cache.
+
+    Raises:
+        RuntimeError: If the stats query failed (get_queue_stats returns {}),
+            so the cache keeps serving the previous body
+    """
+    stats = get_review_queue().get_queue_stats()
+    if not stats:
+        raise RuntimeError("queue statistics unavailable")
+    return orjson.dumps(stats, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _init_validation_worker() -> None:
+    """Pool initializer: build the validator (and import OpenCV) once per process"""
+    get_image_validator()
+
 
-# Global services (in production, use dependency injection)
-sku_generator = None
-image_validator = None
-review_queue = None
+def _validate_in_worker(image_path: str, reference_image_path: Optional[str] = None):
+    """Run validation inside a pool process; only paths cross the process boundary"""
+    return get_image_validator().validate_image(
+        image_path=image_path,
+        reference_image_path=reference_image_path,
+    )
+
+
+async def _run_validation(
+    pool: ProcessPoolExecutor,
+    image_path: str,
+    reference_image_path: Optional[str] = None,
+):
+    """Validate an image on the process pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, _validate_in_worker, image_path, reference_image_path)
 
 
 # ============================================================================
@@ -44,6 +202,8 @@ review_queue = None
 
 class GenerateSKURequest(BaseModel):
     """Request to generate SKU"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     raw_code: str
     vendor_id: int
     vendor_short: str
@@ -53,28 +213,40 @@ class GenerateSKURequest(BaseModel):
 class GenerateSKUResponse(BaseModel):
     """Response from SKU generation"""
     canonical_sku: str
-    status: str  # "inserted", "conflict_resolved", "error"
+    status: Literal["inserted", "conflict_resolved", "conflict_unresolved", "error"]
     message: str
 
 
 class ValidateImageRequest(BaseModel):
     """Request to validate image"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     image_url: str
     reference_image_url: Optional[str] = None
     product_id: Optional[int] = None
 
 
+class ValidationCheckScores(BaseModel):
+    """Per-check scores reported by image validation"""
+    background_white: float
+    blur: float
+    object_coverage: float
+    perceptual_similarity: float
+
+
 class ValidateImageResponse(BaseModel):
     """Response from image validation"""
     validation_score: float
-    status: str  # "auto_accepted", "auto_rejected", "needs_review", "error"
+    status: Literal["auto_accepted", "auto_rejected", "needs_review", "error"]
     reason: str
-    checks: Dict[str, Any]
+    checks: ValidationCheckScores
     execution_time_ms: int
 
 
 class CreateReviewTaskRequest(BaseModel):
     """Request to create review task"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     product_id: int
     product_image_id: int
     product_name: str
@@ -88,8 +260,10 @@ class CreateReviewTaskRequest(BaseModel):
 
 class SubmitReviewDecisionRequest(BaseModel):
     """Request to submit review decision"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     review_task_id: int
-    decision: str  # "accepted", "rejected", "requires_edit"
+    decision: Literal["accepted", "rejected", "requires_edit"]
     reviewer_id: int
     reviewer_notes: Optional[str] = None
     reviewer_confidence: int = 5
@@ -100,25 +274,36 @@ class SubmitReviewDecisionRequest(BaseModel):
 # Health & Info Endpoints
 # ============================================================================
 
+# Static bodies are serialized once; a fresh Response is still built per request
+# because middleware (e.g. CORS) appends to the response's header list in place.
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "SKU & Image Validation Pipeline",
+    "version": "1.0.0",
+})
+
+
+@lru_cache(maxsize=1)
+def _config_body() -> bytes:
+    """Serialized /config payload (config is read-only at runtime)"""
+    return orjson.dumps({
+        "image_accept_threshold": config.IMAGE_ACCEPT_THRESHOLD,
+        "image_review_threshold": config.IMAGE_HUMAN_REVIEW_THRESHOLD,
+        "max_auto_regenerate_attempts": config.MAX_AUTO_REGENERATE_ATTEMPTS,
+        "human_review_timeout_hours": config.HUMAN_REVIEW_TIMEOUT_HOURS,
+    })
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "SKU & Image Validation Pipeline",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/config")
 async def get_config():
     """Get current configuration"""
-    return {
-        "image_accept_threshold": config.IMAGE_ACCEPT_THRESHOLD,
-        "image_review_threshold": config.IMAGE_HUMAN_REVIEW_THRESHOLD,
-        "max_auto_regenerate_attempts": config.MAX_AUTO_REGENERATE_ATTEMPTS,
-        "human_review_timeout_hours": config.HUMAN_REVIEW_TIMEOUT_HOURS,
-    }
+    return Response(content=_config_body(), media_type="application/json")
 
 
 # ============================================================================
@@ -126,20 +311,20 @@ async def get_config():
 # ============================================================================
 
 @app.post("/api/v1/sku/generate", response_model=GenerateSKUResponse)
-async def generate_sku(request: GenerateSKURequest):
+async def generate_sku(
+    request: GenerateSKURequest,
+    sku_generator: SKUGenerator = Depends(get_sku_generator),
+):
     """
     Generate unique SKU for product.
     
     Problem 1 solution: Deterministic canonicalization with collision detection.
     """
     try:
-        if not sku_generator:
-            raise HTTPException(status_code=503, detail="SKU service not initialized")
-
         canonical_sku, status = sku_generator.generate_sku(
             raw_code=request.raw_code,
             vendor_id=request.vendor_id,
-            vendor_short=request.vendor_short,
+            vendor_short=sys.intern(request.vendor_short),
         )
 
         if not canonical_sku:
@@ -156,24 +341,24 @@ async def generate_sku(request: GenerateSKURequest):
         )
 
     except Exception as e:
-        logger.error(f"SKU generation error: {e}", exc_info=True)
+        logger.error("SKU generation error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/v1/sku/validate/{canonical_sku}")
-async def validate_sku_uniqueness(canonical_sku: str):
+async def validate_sku_uniqueness(
+    canonical_sku: str,
+    sku_generator: SKUGenerator = Depends(get_sku_generator),
+):
     """Check if SKU is unique in database"""
     try:
-        if not sku_generator:
-            raise HTTPException(status_code=503, detail="SKU service not initialized")
-
         is_unique = sku_generator.validate_sku_uniqueness(canonical_sku)
         return {
             "canonical_sku": canonical_sku,
             "is_unique": is_unique
         }
     except Exception as e:
-        logger.error(f"SKU validation error: {e}")
+        logger.error("SKU validation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -181,43 +366,131 @@ async def validate_sku_uniqueness(canonical_sku: str):
 # Image Validation Endpoints (Problem 2)
 # ============================================================================
 
+UPLOAD_CHUNK_BYTES = 256 * 1024
+MAX_UPLOAD_BYTES = config.IMAGE_MAX_SIZE_MB * 1024 * 1024
+
+
+def _temp_path(name: str) -> str:
+    """
+    Unique path under IMAGE_TEMP_DIRECTORY for a client-supplied file name.
+
+    Only the basename is kept (no directory traversal) and a random token
+    keeps concurrent requests for the same product from clobbering each other.
+    """
+    basename = os.path.basename(name or "") or "image"
+    return os.path.join(config.IMAGE_TEMP_DIRECTORY, f"{secrets.token_hex(8)}_{basename}")
+
+
+def _stream_upload_to_disk(src, dest_path: str, max_bytes: int) -> int:
+    """
+    Copy an uploaded file to disk in fixed-size chunks.
+
+    Runs in a worker thread; peak memory is one chunk regardless of upload size.
+    Aborts with 413 (and removes the partial file) once max_bytes is exceeded.
+
+    Returns:
+        Number of bytes written
+    """
+    size = 0
+    with open(dest_path, "wb") as f:
+        while True:
+            chunk = src.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                break
+            f.write(chunk)
+
+    if size > max_bytes:
+        os.remove(dest_path)
+        raise HTTPException(
+            status_code=413,
+            detail=f"Image exceeds maximum size of {config.IMAGE_MAX_SIZE_MB} MB",
+        )
+    return size
+
+
+async def _download_image(client: httpx.AsyncClient, url: str, dest_path: str) -> int:
+    """
+    Download an image over the shared connection pool and store it at dest_path.
+
+    Each chunk is written to the file as it arrives (on a worker thread), so
+    memory per download stays at one chunk; the size is capped at
+    IMAGE_MAX_SIZE_MB. The caller removes dest_path, including on failure.
+
+    Returns:
+        Number of bytes downloaded
+    """
+    size = 0
+    f = await run_in_threadpool(open, dest_path, "wb")
+    try:
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Image exceeds maximum size of {config.IMAGE_MAX_SIZE_MB} MB",
+                    )
+                await run_in_threadpool(f.write, chunk)
+    finally:
+        await run_in_threadpool(f.close)
+    return size
+
+
 @app.post("/api/v1/image/validate", response_model=ValidateImageResponse)
-async def validate_image(request: ValidateImageRequest):
+async def validate_image(
+    request: ValidateImageRequest,
+    pool: ProcessPoolExecutor = Depends(get_validation_pool),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+):
     """
     Validate product image.
     
     Problem 2 solution: Automated validation with human-in-the-loop fallback.
     """
+    temp_image_path = _temp_path(f"image_{request.product_id}.jpg")
+    reference_path = None
     try:
-        if not image_validator:
-            raise HTTPException(status_code=503, detail="Image validator not initialized")
-
-        # Download image to temporary file (placeholder)
-        # In production: use proper storage service
-        temp_image_path = f"/tmp/image_{request.product_id}.jpg"
+        # Fetch image (and optional reference) over the shared client
+        downloads = [_download_image(http_client, request.image_url, temp_image_path)]
+        if request.reference_image_url:
+            reference_path = _temp_path(f"image_{request.product_id}_ref.jpg")
+            downloads.append(
+                _download_image(http_client, request.reference_image_url, reference_path)
+            )
+        await asyncio.gather(*downloads)
 
-        # Validate
-        metrics = image_validator.validate_image(
-            image_path=temp_image_path,
-            reference_image_path=request.reference_image_url,
-        )
+        # Validate (CPU-bound; runs in a worker process)
+        metrics = await _run_validation(pool, temp_image_path, reference_path)
 
         return ValidateImageResponse(
             validation_score=metrics.overall_score,
             status=metrics.status.value,
             reason=metrics.reason,
-            checks={
-                "background_white": metrics.background_white_score,
-                "blur": metrics.blur_score,
-                "object_coverage": metrics.object_coverage,
-                "perceptual_similarity": metrics.perceptual_similarity,
-            },
+            checks=ValidationCheckScores(
+                background_white=metrics.background_white_score,
+                blur=metrics.blur_score,
+                object_coverage=metrics.object_coverage,
+                perceptual_similarity=metrics.perceptual_similarity,
+            ),
             execution_time_ms=metrics.execution_time_ms,
         )
 
+    except HTTPException:
+        raise
+    except httpx.HTTPError as e:
+        logger.error("Image download error: %s", e)
+        raise HTTPException(status_code=502, detail=f"Could not fetch image: {e}")
     except Exception as e:
-        logger.error(f"Image validation error: {e}", exc_info=True)
+        logger.error("Image validation error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        for path in (temp_image_path, reference_path):
+            if path and os.path.exists(path):
+                os.remove(path)
 
 
 @app.post("/api/v1/image/upload")
@@ -225,27 +498,28 @@ async def upload_product_image(
     file: UploadFile = File(...),
     product_id: int = None,
     auto_validate: bool = True,
+    pool: ProcessPoolExecutor = Depends(get_validation_pool),
 ):
     """
     Upload product image and optionally validate.
     """
     try:
-        # Save uploaded file
-        temp_path = f"/tmp/upload_{product_id}_{file.filename}"
-        with open(temp_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        # Stream uploaded file to disk
+        temp_path = _temp_path(f"upload_{product_id}_{os.path.basename(file.filename or '')}")
+        size_bytes = await run_in_threadpool(
+            _stream_upload_to_disk, file.file, temp_path, MAX_UPLOAD_BYTES
+        )
 
         response = {
             "filename": file.filename,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
             "product_id": product_id,
             "stored_at": temp_path,
         }
 
         # Auto-validate if requested
-        if auto_validate and image_validator:
-            metrics = image_validator.validate_image(temp_path)
+        if auto_validate:
+            metrics = await _run_validation(pool, temp_path)
             response["validation"] = {
                 "score": metrics.overall_score,
                 "status": metrics.status.value,
@@ -254,8 +528,10 @@ async def upload_product_image(
 
         return response
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Image upload error: {e}", exc_info=True)
+        logger.error("Image upload error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -264,12 +540,12 @@ async def upload_product_image(
 # ============================================================================
 
 @app.post("/api/v1/review/create-task")
-async def create_review_task(request: CreateReviewTaskRequest):
+async def create_review_task(
+    request: CreateReviewTaskRequest,
+    review_queue: ReviewQueue = Depends(get_review_queue),
+):
     """Create human review task for low-confidence image"""
     try:
-        if not review_queue:
-            raise HTTPException(status_code=503, detail="Review queue not initialized")
-
         task_id = review_queue.create_review_task(
             product_id=request.product_id,
             product_image_id=request.product_image_id,
@@ -289,46 +565,35 @@ async def create_review_task(request: CreateReviewTaskRequest):
         }
 
     except Exception as e:
-        logger.error(f"Review task creation error: {e}", exc_info=True)
+        logger.error("Review task creation error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/v1/review/pending")
-async def get_pending_review_tasks(limit: int = 50, priority: Optional[int] = None):
-    """Get pending review tasks"""
+async def get_pending_review_tasks(
+    limit: int = 50,
+    priority: Optional[int] = None,
+    review_queue: ReviewQueue = Depends(get_review_queue),
+):
+    """Get pending review tasks (body is serialized by the database)"""
     try:
-        if not review_queue:
-            raise HTTPException(status_code=503, detail="Review queue not initialized")
-
-        tasks = review_queue.get_pending_tasks(limit=limit, priority_filter=priority)
-        return {
-            "task_count": len(tasks),
-            "tasks": [
-                {
-                    "id": t.id,
-                    "product_name": t.product_name,
-                    "canonical_sku": t.canonical_sku,
-                    "validation_score": t.validation_score,
-                    "priority": t.priority,
-                    "created_at": t.created_at.isoformat() if t.created_at else None,
-                    "due_by": t.due_by.isoformat() if t.due_by else None,
-                }
-                for t in tasks
-            ]
-        }
+        body = await run_in_threadpool(
+            review_queue.get_pending_tasks_json, limit=limit, priority_filter=priority
+        )
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Get pending tasks error: {e}")
+        logger.error("Get pending tasks error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/v1/review/task/{task_id}")
-async def get_review_task(task_id: int):
+async def get_review_task(
+    task_id: int,
+    review_queue: ReviewQueue = Depends(get_review_queue),
+):
     """Get specific review task"""
     try:
-        if not review_queue:
-            raise HTTPException(status_code=503, detail="Review queue not initialized")
-
         task = review_queue.get_review_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
@@ -347,31 +612,21 @@ async def get_review_task(task_id: int):
         }
 
     except Exception as e:
-        logger.error(f"Get task error: {e}")
+        logger.error("Get task error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/v1/review/submit-decision")
-async def submit_review_decision(request: SubmitReviewDecisionRequest):
+async def submit_review_decision(
+    request: SubmitReviewDecisionRequest,
+    review_queue: ReviewQueue = Depends(get_review_queue),
+):
     """Submit reviewer's decision"""
     try:
-        if not review_queue:
-            raise HTTPException(status_code=503, detail="Review queue not initialized")
-
-        # Map string decision to enum
-        decision_map = {
-            "accepted": ReviewDecision.ACCEPTED,
-            "rejected": ReviewDecision.REJECTED,
-            "requires_edit": ReviewDecision.REQUIRES_EDIT,
-        }
-
-        decision = decision_map.get(request.decision.lower())
-        if not decision:
-            raise HTTPException(status_code=400, detail="Invalid decision")
-
+        # Decision already validated by the request model
         result = review_queue.submit_review_decision(
             review_task_id=request.review_task_id,
-            decision=decision,
+            decision=_DECISION_MAP[request.decision],
             reviewer_id=request.reviewer_id,
             reviewer_notes=request.reviewer_notes,
             reviewer_confidence=request.reviewer_confidence,
@@ -389,22 +644,19 @@ async def submit_review_decision(request: SubmitReviewDecisionRequest):
             raise HTTPException(status_code=500, detail="Failed to record decision")
 
     except Exception as e:
-        logger.error(f"Submit decision error: {e}", exc_info=True)
+        logger.error("Submit decision error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/v1/review/stats")
-async def get_queue_statistics():
-    """Get review queue statistics"""
+async def get_queue_statistics(request: Request):
+    """Get review queue statistics (cached for REVIEW_STATS_CACHE_TTL_SECONDS)"""
     try:
-        if not review_queue:
-            raise HTTPException(status_code=503, detail="Review queue not initialized")
-
-        stats = review_queue.get_queue_stats()
-        return stats
+        body = await request.app.state.stats_cache.get()
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Get stats error: {e}")
+        logger.error("Get stats error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -412,30 +664,68 @@ async def get_queue_statistics():
 # Startup & Shutdown
 # ============================================================================
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Route root log records through a queue so handlers write them on a
+    background thread instead of in the request path. (QueueHandler still
+    renders the message and traceback in the caller, so the queued record
+    holds no mutable args or live frames.)
+
+    Returns:
+        Started listener; stop it (and restore handlers) with _stop_log_listener
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: logging.handlers.QueueListener) -> None:
+    """Flush queued records and put the original handlers back on the root logger"""
+    listener.stop()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+
 @app.on_event("startup")
 async def startup():
-    """Initialize services on startup"""
-    global sku_generator, image_validator, review_queue
-
+    """Initialize services on startup (warms the provider caches)"""
+    app.state.log_listener = _start_log_listener()
     logger.info("Initializing services...")
-    
-    # Initialize SKU generator (no DB for demo)
-    sku_generator = SKUGenerator(db_connection=None)
+
+    os.makedirs(config.IMAGE_TEMP_DIRECTORY, exist_ok=True)
+
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=10.0,
+        follow_redirects=True,
+    )
+
+    get_sku_generator().refresh_sku_bloom()
     logger.info("SKU generator initialized")
 
-    # Initialize image validator
-    image_validator = ImageValidator(
-        background_white_threshold=config.BACKGROUND_WHITE_THRESHOLD,
-        blur_threshold=config.BLUR_THRESHOLD,
-        object_coverage_min=config.OBJECT_COVERAGE_MIN,
-        object_coverage_max=config.OBJECT_COVERAGE_MAX,
-        accept_score_threshold=config.IMAGE_ACCEPT_THRESHOLD,
-        review_score_threshold=config.IMAGE_HUMAN_REVIEW_THRESHOLD,
+    # Image validator (and OpenCV) is loaded in the pool processes, which are
+    # spawned on the first /api/v1/image/* call
+    app.state.cv_pool = ProcessPoolExecutor(
+        max_workers=config.IMAGE_VALIDATION_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_validation_worker,
     )
-    logger.info("Image validator initialized")
 
-    # Initialize review queue (no DB for demo)
-    review_queue = ReviewQueue(db_connection=None)
+    get_review_queue()
+    app.state.stats_cache = _StaleWhileRevalidateCache(
+        _load_queue_stats, config.REVIEW_STATS_CACHE_TTL_SECONDS
+    )
     logger.info("Review queue initialized")
 
     logger.info("All services initialized successfully")
@@ -445,6 +735,9 @@ async def startup():
 async def shutdown():
     """Clean up on shutdown"""
     logger.info("Shutting down services")
+    await app.state.http.aclose()
+    app.state.cv_pool.shutdown(wait=False, cancel_futures=True)
+    _stop_log_listener(app.state.log_listener)
 
 
 # ============================================================================
@@ -454,8 +747,10 @@ async def shutdown():
 if __name__ == "__main__":
     import uvicorn
 
+    # Import string (not the app object) so `workers` is honoured.
+    # Production: gunicorn -k uvicorn.workers.UvicornWorker -w N backend.main:app
     uvicorn.run(
-        app,
+        "backend.main:app",
         host=config.API_HOST,
         port=config.API_PORT,
         workers=config.API_WORKERS,
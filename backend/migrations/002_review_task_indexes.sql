@@ -0,0 +1,33 @@
+-- Indexes for the review queue read paths.
+-- Postgres 12+
+--
+-- Run with:
+--     psql -U postgres -f backend/migrations/002_review_task_indexes.sql
+--
+-- CONCURRENTLY builds without blocking writes, so this cannot run inside a
+-- transaction block (don't wrap it in BEGIN/COMMIT).
+--
+-- Most review_tasks rows end up accepted/rejected and are never scanned by
+-- the queue again, so the queue indexes cover only open tasks: a small,
+-- RAM-resident fraction of the table.
+
+-- Pending queue and claim_next_task: WHERE status = 'pending' [AND priority = ?]
+-- ORDER BY priority, due_by LIMIT n
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_review_tasks_pending
+    ON review_tasks (priority, due_by) INCLUDE (assigned_to)
+    WHERE status = 'pending';
+
+-- Overdue scan: WHERE status IN ('pending', 'in_progress') AND due_by < NOW()
+-- (INCLUDE lets the id/product_id listing be an index-only scan)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_review_tasks_open_due
+    ON review_tasks (due_by) INCLUDE (id, product_id)
+    WHERE status IN ('pending', 'in_progress');
+
+-- Reviewer worklist: WHERE assigned_to = ? AND status IN (...)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_review_tasks_assignee_status
+    ON review_tasks (assigned_to, status);
+
+-- Superseded: assigned_to is the leading prefix of the worklist index, and
+-- status-only lookups are the queue scans covered above
+DROP INDEX CONCURRENTLY IF EXISTS idx_review_tasks_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_review_tasks_assigned_to;
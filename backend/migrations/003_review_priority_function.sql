@@ -0,0 +1,25 @@
+-- Score-to-priority bucketing in SQL, mirroring ReviewQueue._compute_priority.
+-- Postgres 12+
+--
+-- Run with:
+--     psql -U postgres -f backend/migrations/003_review_priority_function.sql
+--
+-- priority stays a plain column (not GENERATED) because reviewers and callers
+-- can override it; this function lets bulk loads and backfills derive it in
+-- one statement instead of per-row round-trips, e.g.
+--     UPDATE review_tasks SET priority = review_priority(validation_score)
+--     WHERE status = 'pending' AND assigned_to IS NULL;
+
+CREATE OR REPLACE FUNCTION review_priority(score NUMERIC)
+RETURNS SMALLINT
+LANGUAGE SQL
+IMMUTABLE PARALLEL SAFE
+AS $$
+    SELECT CASE
+        WHEN score < 0.40 THEN 1   -- Urgent
+        WHEN score < 0.55 THEN 2   -- High
+        WHEN score < 0.70 THEN 3   -- Normal
+        WHEN score < 0.80 THEN 4   -- Low
+        ELSE 5                     -- Very low
+    END::SMALLINT
+$$;
@@ -0,0 +1,20 @@
+"""
+Shared response classes for the FastAPI apps.
+"""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Serializes datetime, UUID and NumPy scalars/arrays natively, so handlers
+    can return them without converting to strings or Python floats first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
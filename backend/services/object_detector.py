@@ -0,0 +1,138 @@
+"""
+Object Detector: batched ML product detection for image validation
+
+Key features:
+- ONNX Runtime session loaded once, GPU first with CPU fallback
+- Letterbox preprocessing that can run on CPU worker threads
+- One session.run per batch of images (YOLOv8-style output)
+"""
+
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    ort = None
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROVIDERS = ("CUDAExecutionProvider", "CPUExecutionProvider")
+LETTERBOX_FILL = 114  # Ultralytics padding grey
+
+# ONNX input element type -> numpy dtype fed to session.run
+_INPUT_DTYPES = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+}
+
+
+class Detector:
+    """
+    Wraps a YOLO-style ONNX model that scores how clearly an image shows a
+    product. Preprocessing (preprocess) and inference (score_batch) are
+    separate so a batch validator can letterbox on its worker threads and
+    then run the model once for the whole group.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        providers: Sequence[str] = DEFAULT_PROVIDERS,
+        input_size: int = 640,
+    ):
+        """
+        Initialize detector.
+
+        Args:
+            model_path: Path to an ONNX model with input (N, 3, S, S) and
+                output (N, 4 + classes, anchors)
+            providers: ONNX Runtime execution providers, in preference order
+                (ones not available in this build are skipped)
+            input_size: Square model input side S
+
+        The input dtype follows the model: float16 for half=True exports,
+        float32 otherwise.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed; cannot load object detector")
+        if not CV2_AVAILABLE:
+            raise RuntimeError("OpenCV is not installed; cannot preprocess for object detector")
+
+        available = set(ort.get_available_providers())
+        chosen = [p for p in providers if p in available] or ["CPUExecutionProvider"]
+        self.session = ort.InferenceSession(model_path, providers=chosen)
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_size = input_size
+        self.dtype = _INPUT_DTYPES.get(model_input.type)
+        if self.dtype is None:
+            raise RuntimeError(f"Unsupported object detector input type: {model_input.type}")
+        logger.info("Object detector loaded: %s on %s", model_path, self.session.get_providers()[0])
+
+    def preprocess(self, bgr: np.ndarray) -> np.ndarray:
+        """
+        Letterbox an image to the model input and normalize it.
+
+        Args:
+            bgr: Decoded image (HxWx3 uint8)
+
+        Returns:
+            (3, S, S) tensor in RGB order, scaled to [0, 1]
+        """
+        size = self.input_size
+        h, w = bgr.shape[:2]
+        scale = size / max(h, w)
+        nh, nw = max(1, round(h * scale)), max(1, round(w * scale))
+        resized = cv2.resize(bgr, (nw, nh), interpolation=cv2.INTER_LINEAR)
+
+        canvas = np.full((size, size, 3), LETTERBOX_FILL, dtype=np.uint8)
+        top, left = (size - nh) // 2, (size - nw) // 2
+        canvas[top:top + nh, left:left + nw] = resized
+
+        tensor = canvas[..., ::-1].transpose(2, 0, 1).astype(self.dtype)
+        tensor *= self.dtype(1.0 / 255.0)
+        return tensor
+
+    def score_batch(self, tensors: np.ndarray) -> np.ndarray:
+        """
+        Run the model once over a batch of preprocessed images.
+
+        Args:
+            tensors: (N, 3, S, S) stack of preprocess() outputs
+
+        Returns:
+            (N,) float64 best detection confidence per image (0-1)
+        """
+        (raw,) = self.session.run(None, {self.input_name: np.ascontiguousarray(tensors)})
+        # YOLOv8 layout: rows 0-3 are the box, the rest are per-class scores
+        class_scores = np.asarray(raw, dtype=np.float32)[:, 4:, :]
+        return class_scores.max(axis=(1, 2)).astype(np.float64)
+
+    def score(self, bgr: np.ndarray) -> float:
+        """Detection confidence for a single image (a batch of one)"""
+        return float(self.score_batch(self.preprocess(bgr)[None])[0])
+
+
+def load_detector(model_path: Optional[str], **kwargs) -> Optional[Detector]:
+    """
+    Build a Detector, or return None when no model is configured or
+    onnxruntime is unavailable (validation then uses the neutral score).
+    """
+    if not model_path:
+        return None
+    if not ONNXRUNTIME_AVAILABLE:
+        logger.warning("onnxruntime not available; object detection disabled")
+        return None
+    return Detector(model_path, **kwargs)
@@ -9,8 +9,16 @@ Key features:
 - Support for image editing/correction
 """
 
+import bisect
+import itertools
+import json
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Sequence
 from enum import Enum
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -18,6 +26,152 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+# Review deadline by priority, indexed by level (config.HUMAN_REVIEW_PRIORITY_LEVELS:
+# urgent=1 -> 2h, high=2 -> 8h, normal=3 -> 24h, low=4 -> 48h). Other levels use the default SLA.
+_PRIORITY_DEADLINE = (
+    None,
+    timedelta(hours=2),
+    timedelta(hours=8),
+    timedelta(hours=24),
+    timedelta(hours=48),
+)
+
+# Upper score bounds of priorities 1-4 (anything higher is 5); the SQL function
+# review_priority() in migrations/003 uses the same buckets
+_PRIORITY_SCORE_BOUNDS = (0.40, 0.55, 0.70, 0.80)
+
+
+# Pending-task listing assembled entirely in PostgreSQL: one round-trip returns
+# the serialized response body (json_agg keeps column order, unlike jsonb_agg).
+_PENDING_TASKS_JSON_SQL = """
+SELECT json_build_object(
+    'task_count', count(*),
+    'tasks', coalesce(json_agg(t ORDER BY t.priority, t.due_by), '[]'::json)
+)::text
+FROM (
+    SELECT rt.id, p.product_name, p.canonical_sku, rt.validation_score,
+           rt.priority, rt.created_at, rt.due_by
+    FROM review_tasks rt
+    JOIN products p ON p.id = rt.product_id
+    WHERE rt.status = 'pending'
+      AND (%(priority)s::int IS NULL OR rt.priority = %(priority)s::int)
+    ORDER BY rt.priority, rt.due_by
+    LIMIT %(limit)s
+) t
+"""
+_EMPTY_PENDING_TASKS_JSON = b'{"task_count":0,"tasks":[]}'
+
+# ReviewTask rows: task columns plus the product/image fields reviewers see.
+# Each WHERE filters on rt.status (or rt.assigned_to) so it matches the
+# partial indexes (or the assignee index) from migrations/002.
+_TASK_SELECT_SQL = """
+SELECT rt.id, rt.task_uuid, rt.product_id, rt.product_image_id,
+       p.product_name, p.vendor_code, p.canonical_sku, pi.image_url,
+       rt.validation_score, rt.validation_checks, rt.failure_reason,
+       rt.status::text, rt.created_at, rt.due_by, rt.assigned_to, rt.priority
+FROM review_tasks rt
+JOIN products p ON p.id = rt.product_id
+LEFT JOIN product_images pi ON pi.id = rt.product_image_id
+"""
+_PENDING_TASKS_SQL = _TASK_SELECT_SQL + """
+WHERE rt.status = 'pending'
+  AND (%(priority)s::int IS NULL OR rt.priority = %(priority)s::int)
+ORDER BY rt.priority, rt.due_by
+LIMIT %(limit)s
+"""
+_ASSIGNED_TASKS_SQL = _TASK_SELECT_SQL + """
+WHERE rt.assigned_to = %(reviewer_id)s
+  AND rt.status IN ('pending', 'in_progress')
+ORDER BY rt.priority, rt.due_by
+"""
+# Multi-row insert for create_review_tasks_bulk (psycopg2 execute_values fills VALUES %s)
+_INSERT_REVIEW_TASKS_SQL = """
+INSERT INTO review_tasks (task_uuid, product_id, product_image_id, validation_score,
+                          validation_checks, failure_reason, priority, due_by)
+VALUES %s
+RETURNING id
+"""
+_INSERT_REVIEW_TASKS_TEMPLATE = "(%s, %s, %s, %s, %s::jsonb, %s, %s, %s)"
+_INSERT_REVIEW_TASK_SQL = _INSERT_REVIEW_TASKS_SQL.replace("%s", _INSERT_REVIEW_TASKS_TEMPLATE)
+
+# Dequeue for concurrent reviewers: lock the most urgent unassigned task,
+# skipping rows other transactions hold, and claim it in the same statement
+_CLAIM_NEXT_TASK_SQL = """
+UPDATE review_tasks
+SET assigned_to = %(reviewer_id)s, assigned_at = NOW(), started_at = NOW(),
+    status = 'in_progress'
+WHERE id = (
+    SELECT id FROM review_tasks
+    WHERE status = 'pending' AND assigned_to IS NULL
+      AND (%(priority)s::int IS NULL OR priority = %(priority)s::int)
+    ORDER BY priority, due_by
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING id
+"""
+_ASSIGN_TASK_SQL = """
+UPDATE review_tasks
+SET assigned_to = %(reviewer_id)s, assigned_at = NOW()
+WHERE id = %(task_id)s AND status = 'pending'
+"""
+
+# Decisions for many tasks in one transaction: one multi-row feedback INSERT
+# and one UPDATE joined against a VALUES list (execute_values fills VALUES %s)
+_INSERT_FEEDBACK_SQL = """
+INSERT INTO review_feedback (review_task_id, reviewer_id, decision, decision_reason,
+                             corrected_image_url, feedback_text, reviewer_confidence,
+                             marked_for_training)
+VALUES %s
+"""
+_UPDATE_DECIDED_TASKS_SQL = """
+UPDATE review_tasks AS t
+SET status = v.status::review_status, completed_at = NOW()
+FROM (VALUES %s) AS v(id, status)
+WHERE t.id = v.id
+"""
+
+# Queue statistics aggregated in one pass over review_tasks; only a single row
+# crosses the wire
+_QUEUE_STATS_SQL = """
+SELECT
+    count(*) FILTER (WHERE status = 'pending'),
+    count(*) FILTER (WHERE status = 'in_progress'),
+    count(*) FILTER (WHERE status = 'pending' AND due_by < NOW()),
+    coalesce(avg(EXTRACT(EPOCH FROM (completed_at - started_at)) / 60)
+             FILTER (WHERE completed_at IS NOT NULL AND started_at IS NOT NULL), 0),
+    count(*) FILTER (WHERE status = 'pending' AND priority <= 2)
+FROM review_tasks
+"""
+
+# Per-reviewer metrics aggregated in SQL (one row back, no per-decision objects)
+_REVIEWER_METRICS_SQL = """
+SELECT
+    count(*),
+    count(*) FILTER (WHERE rf.decision = 'accepted'),
+    count(*) FILTER (WHERE rf.decision = 'rejected'),
+    count(*) FILTER (WHERE rf.decision IN ('requires_edit', 'needs_edit')),
+    coalesce(avg(EXTRACT(EPOCH FROM (
+        rf.created_at - coalesce(rt.started_at, rt.assigned_at, rt.created_at)
+    )) / 60), 0),
+    coalesce(avg(rf.reviewer_confidence), 0)
+FROM review_feedback rf
+JOIN review_tasks rt ON rt.id = rf.review_task_id
+WHERE rf.reviewer_id = %(reviewer_id)s
+"""
+
+_OVERDUE_TASKS_SQL = _TASK_SELECT_SQL + """
+WHERE rt.status IN ('pending', 'in_progress')
+  AND rt.due_by < NOW()
+ORDER BY rt.due_by
+"""
+
+
+@lru_cache(maxsize=1)
+def _training_executor() -> ThreadPoolExecutor:
+    """Single background thread for training-data export (off the request path)"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="review-training")
+
 
 class ReviewStatus(Enum):
     """Review task status"""
@@ -36,11 +190,22 @@ class ReviewDecision(Enum):
     NEEDS_REGENERATION = "needs_regeneration"
 
 
-@dataclass
+# Task status a decision moves the task to (regeneration is a kind of edit)
+_DECISION_TASK_STATUS = {
+    ReviewDecision.ACCEPTED: ReviewStatus.ACCEPTED,
+    ReviewDecision.REJECTED: ReviewStatus.REJECTED,
+    ReviewDecision.REQUIRES_EDIT: ReviewStatus.REQUIRES_EDIT,
+    ReviewDecision.NEEDS_REGENERATION: ReviewStatus.REQUIRES_EDIT,
+}
+# Decisions clear enough to use as model training labels
+_TRAINING_DECISIONS = frozenset((ReviewDecision.ACCEPTED, ReviewDecision.REJECTED))
+
+
+@dataclass(slots=True, frozen=True)
 class ReviewTask:
     """Single human review task"""
     id: int
-    task_uuid: str
+    task_uuid: uuid.UUID
     product_id: int
     product_image_id: int
     product_name: str
@@ -56,14 +221,50 @@ class ReviewTask:
     assigned_to: Optional[int] = None
     priority: int = 3  # 1=urgent, 5=low
     
-    def is_overdue(self) -> bool:
-        return datetime.now() > self.due_by
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        return (now or datetime.now()) > self.due_by
     
-    def days_to_due(self) -> float:
-        return (self.due_by - datetime.now()).total_seconds() / 86400
+    def days_to_due(self, now: Optional[datetime] = None) -> float:
+        return (self.due_by - (now or datetime.now())).total_seconds() / 86400
+
+    @classmethod
+    def bulk_stats(cls, tasks: List["ReviewTask"], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Overdue count and average days to due for many tasks, against one
+        clock read.
+
+        Returns:
+            {"overdue_count": int, "avg_days_to_due": float}
+        """
+        now = now or datetime.now()
+        overdue = 0
+        total_seconds = 0.0
+        for task in tasks:
+            if now > task.due_by:
+                overdue += 1
+            total_seconds += (task.due_by - now).total_seconds()
+        return {
+            "overdue_count": overdue,
+            "avg_days_to_due": total_seconds / 86400 / len(tasks) if tasks else 0.0,
+        }
+
+
+def filter_overdue(tasks: List[ReviewTask], now: Optional[datetime] = None) -> List[ReviewTask]:
+    """
+    Tasks past their due date, checked against a single clock read.
 
+    Args:
+        tasks: Tasks to filter
+        now: Reference time (default: datetime.now())
 
-@dataclass
+    Returns:
+        The overdue tasks, in input order
+    """
+    now = now or datetime.now()
+    return [t for t in tasks if now > t.due_by]
+
+
+@dataclass(slots=True, frozen=True)
 class ReviewDecisionInput:
     """Data submitted by reviewer"""
     review_task_id: int
@@ -74,7 +275,7 @@ class ReviewDecisionInput:
     corrected_image_url: Optional[str] = None  # If reviewer uploaded new image
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewerMetrics:
     """Metrics for a single reviewer"""
     reviewer_id: int
@@ -87,6 +288,70 @@ class ReviewerMetrics:
     agreement_rate: Optional[float] = None  # If inter-rater agreement computed
 
 
+class RoundRobinDispatcher:
+    """
+    Picks reviewers for auto-assignment from an in-memory rotation.
+
+    The reviewer list is loaded once and refreshed every refresh_secs, so
+    picking a reviewer is a next() on an iterator rather than a workload
+    query per assignment.
+
+    The rotation order comes from `strategy`, which turns the reviewer list
+    into an endless iterator. The default is plain round-robin
+    (itertools.cycle); a weighted or expertise-aware strategy can be passed
+    in without changing the dispatcher.
+
+    Example:
+        dispatcher = RoundRobinDispatcher(queue.get_reviewer_ids)
+        queue.assign_task(task_id, dispatcher.next_reviewer())
+    """
+
+    def __init__(
+        self,
+        load_reviewers: Callable[[], Sequence[int]],
+        refresh_secs: float = 60.0,
+        strategy: Callable[[Sequence[int]], Iterator[int]] = itertools.cycle,
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            load_reviewers: Returns the current reviewer IDs
+            refresh_secs: How long a loaded reviewer list is used
+            strategy: Builds the (endless) assignment order from the reviewer IDs
+        """
+        self._load_reviewers = load_reviewers
+        self.refresh_secs = refresh_secs
+        self._strategy = strategy
+        self._cycle: Optional[Iterator[int]] = None
+        self._reviewers: Tuple[int, ...] = ()
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def next_reviewer(self) -> Optional[int]:
+        """
+        Next reviewer in the rotation.
+
+        Returns:
+            Reviewer ID, or None if there are no active reviewers
+        """
+        with self._lock:
+            if self._cycle is None or time.monotonic() - self._loaded_at >= self.refresh_secs:
+                self._refresh()
+            if not self._reviewers:
+                return None
+            return next(self._cycle)
+
+    def _refresh(self) -> None:
+        reviewers = tuple(self._load_reviewers())
+        self._loaded_at = time.monotonic()
+        # Keep the current position when the list hasn't changed
+        if reviewers != self._reviewers or self._cycle is None:
+            self._reviewers = reviewers
+            self._cycle = self._strategy(reviewers) if reviewers else iter(())
+            logger.debug("Reviewer rotation reloaded: %s reviewers", len(reviewers))
+
+
 class ReviewQueue:
     """
     Manages the human-in-the-loop review queue.
@@ -125,18 +390,34 @@ class ReviewQueue:
         db_connection: Any,
         default_sla_hours: int = 48,
         enable_priority_assignment: bool = True,
+        training_export: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        reviewer_ids: Sequence[int] = (),
     ):
         """
         Initialize review queue manager.
         
         Args:
-            db_connection: Database connection pool
+            db_connection: Database connection (psycopg2), or None for mock mode
             default_sla_hours: Default SLA for review tasks
             enable_priority_assignment: Auto-assign priority based on validation score
+            training_export: Called in the background with accepted/rejected
+                decisions to add to the training dataset
+            reviewer_ids: Reviewer roster for auto-assignment (see get_reviewer_ids)
         """
         self.db = db_connection
+        self.reviewer_ids = tuple(sorted(set(reviewer_ids)))
         self.default_sla_hours = default_sla_hours
         self.enable_priority_assignment = enable_priority_assignment
+        self.training_export = training_export
+        if db_connection is not None:
+            # Send/receive task_uuid as uuid.UUID (16-byte binary UUID column)
+            # rather than formatting and re-parsing 36-char strings
+            from psycopg2.extras import register_uuid
+
+            register_uuid(conn_or_curs=db_connection)
+        self._default_sla = timedelta(hours=default_sla_hours)
+        # Task IDs handed out when running without a database (unique per queue)
+        self._mock_task_ids = itertools.count(1)
 
     def create_review_task(
         self,
@@ -166,38 +447,91 @@ class ReviewQueue:
             validation_checks: Dict of individual check results
             failure_reason: Why it needs review (e.g., "Low object coverage")
             priority: Manual priority override (1=urgent, 5=low)
-            sla_hours: Override default SLA
+            sla_hours: Override the priority-based SLA
             
         Returns:
             Review task ID
         """
         try:
-            # Auto-compute priority if not specified
-            if priority is None and self.enable_priority_assignment:
-                priority = self._compute_priority(validation_score)
-            else:
-                priority = priority or 3
+            priority, due_by = self._priority_and_due(validation_score, priority, sla_hours, datetime.now())
 
-            # Compute due date
-            sla_hours = sla_hours or self.default_sla_hours
-            due_by = datetime.now() + timedelta(hours=sla_hours)
+            # task_uuid is the external reference; the serial id is what joins use
+            task_uuid = uuid.uuid4()
+            if self.db is None:
+                task_id = next(self._mock_task_ids)
+            else:
+                with self.db.cursor() as cursor:
+                    cursor.execute(
+                        _INSERT_REVIEW_TASK_SQL,
+                        (task_uuid, product_id, product_image_id, validation_score,
+                         json.dumps(validation_checks), failure_reason, priority, due_by),
+                    )
+                    (task_id,) = cursor.fetchone()
+                self.db.commit()
 
-            # Insert task (placeholder; implement with actual DB)
-            task_uuid = str(uuid.uuid4())
-            
             logger.info(
-                f"Created review task {task_uuid}: product={product_id}, "
-                f"sku={canonical_sku}, score={validation_score:.2f}, priority={priority}"
+                "Created review task %s (%s): product=%s, sku=%s, score=%.2f, priority=%s",
+                task_id, task_uuid, product_id, canonical_sku, validation_score, priority,
             )
+            return task_id
 
-            # Mock: return a fake ID
-            # In real implementation, return actual DB insert ID
-            return hash(task_uuid) % 1000000
+        except Exception as e:
+            logger.error("Failed to create review task: %s", e, exc_info=True)
+            raise
 
+    def create_review_tasks_bulk(self, tasks: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many review tasks with a single multi-row INSERT.
+
+        Args:
+            tasks: One dict of create_review_task keyword arguments per task
+
+        Returns:
+            Review task IDs, in the order of `tasks`
+        """
+        if not tasks:
+            return []
+        if self.db is None:
+            return [self.create_review_task(**task) for task in tasks]
+
+        # Priority and deadline for every row up front, against one clock read
+        now = datetime.now()
+        rows = []
+        for task in tasks:
+            priority, due_by = self._priority_and_due(
+                task["validation_score"], task.get("priority"), task.get("sla_hours"), now
+            )
+            rows.append((
+                uuid.uuid4(),
+                task["product_id"],
+                task["product_image_id"],
+                task["validation_score"],
+                json.dumps(task["validation_checks"]),
+                task["failure_reason"],
+                priority,
+                due_by,
+            ))
+
+        try:
+            from psycopg2.extras import execute_values
+
+            with self.db.cursor() as cursor:
+                returned = execute_values(
+                    cursor,
+                    _INSERT_REVIEW_TASKS_SQL,
+                    rows,
+                    template=_INSERT_REVIEW_TASKS_TEMPLATE,
+                    page_size=len(rows),
+                    fetch=True,
+                )
+            self.db.commit()
         except Exception as e:
-            logger.error(f"Failed to create review task: {e}", exc_info=True)
+            logger.error("Failed to create %s review tasks: %s", len(rows), e, exc_info=True)
             raise
 
+        logger.info("Created %s review tasks in one insert", len(returned))
+        return [task_id for (task_id,) in returned]
+
     def get_review_task(self, task_id: int) -> Optional[ReviewTask]:
         """
         Fetch a review task by ID.
@@ -209,11 +543,11 @@ class ReviewQueue:
             ReviewTask object or None if not found
         """
         try:
-            logger.debug(f"Fetching review task {task_id}")
+            logger.debug("Fetching review task %s", task_id)
             # Placeholder: implement with actual DB query
             return None
         except Exception as e:
-            logger.error(f"Failed to fetch review task {task_id}: {e}")
+            logger.error("Failed to fetch review task %s: %s", task_id, e)
             return None
 
     def get_pending_tasks(self, limit: int = 50, priority_filter: Optional[int] = None) -> List[ReviewTask]:
@@ -228,13 +562,38 @@ class ReviewQueue:
             List of ReviewTask objects
         """
         try:
-            logger.debug(f"Fetching {limit} pending tasks")
-            # Placeholder: implement with actual DB query
-            return []
+            logger.debug("Fetching %s pending tasks", limit)
+            return self._fetch_tasks(_PENDING_TASKS_SQL, {"limit": limit, "priority": priority_filter})
         except Exception as e:
-            logger.error(f"Failed to fetch pending tasks: {e}")
+            logger.error("Failed to fetch pending tasks: %s", e)
             return []
 
+    def get_pending_tasks_json(self, limit: int = 50, priority_filter: Optional[int] = None) -> bytes:
+        """
+        Get pending review tasks as a ready-to-send JSON body.
+
+        Args:
+            limit: Maximum number of tasks to return
+            priority_filter: Optional filter by priority (1=most urgent)
+
+        Returns:
+            UTF-8 JSON bytes: {"task_count": N, "tasks": [...]}
+        """
+        if self.db is None:
+            return _EMPTY_PENDING_TASKS_JSON
+
+        try:
+            with self.db.cursor() as cursor:
+                cursor.execute(
+                    _PENDING_TASKS_JSON_SQL,
+                    {"limit": limit, "priority": priority_filter},
+                )
+                (body,) = cursor.fetchone()
+            return body.encode()
+        except Exception as e:
+            logger.error("Failed to fetch pending tasks: %s", e)
+            return _EMPTY_PENDING_TASKS_JSON
+
     def get_assigned_tasks(self, reviewer_id: int) -> List[ReviewTask]:
         """
         Get tasks assigned to a specific reviewer.
@@ -246,11 +605,10 @@ class ReviewQueue:
             List of ReviewTask objects
         """
         try:
-            logger.debug(f"Fetching tasks assigned to reviewer {reviewer_id}")
-            # Placeholder
-            return []
+            logger.debug("Fetching tasks assigned to reviewer %s", reviewer_id)
+            return self._fetch_tasks(_ASSIGNED_TASKS_SQL, {"reviewer_id": reviewer_id})
         except Exception as e:
-            logger.error(f"Failed to fetch tasks for reviewer {reviewer_id}: {e}")
+            logger.error("Failed to fetch tasks for reviewer %s: %s", reviewer_id, e)
             return []
 
     def assign_task(self, task_id: int, reviewer_id: int) -> bool:
@@ -265,13 +623,78 @@ class ReviewQueue:
             True if assigned successfully
         """
         try:
-            logger.info(f"Assigning task {task_id} to reviewer {reviewer_id}")
-            # Placeholder: implement with actual DB update
-            return True
+            logger.info("Assigning task %s to reviewer %s", task_id, reviewer_id)
+            if self.db is None:
+                return True
+            with self.db.cursor() as cursor:
+                cursor.execute(_ASSIGN_TASK_SQL, {"task_id": task_id, "reviewer_id": reviewer_id})
+                assigned = cursor.rowcount == 1
+            self.db.commit()
+            return assigned
         except Exception as e:
-            logger.error(f"Failed to assign task {task_id}: {e}")
+            logger.error("Failed to assign task %s: %s", task_id, e)
             return False
 
+    def get_reviewer_ids(self) -> List[int]:
+        """
+        Reviewer roster for auto-assignment.
+
+        Taken from configuration rather than inferred from decision history,
+        so a newly added reviewer is assigned work before their first review.
+
+        Returns:
+            Reviewer IDs, ascending
+        """
+        return list(self.reviewer_ids)
+
+    def auto_assign_task(self, task_id: int, dispatcher: RoundRobinDispatcher) -> Optional[int]:
+        """
+        Assign a task to the dispatcher's next reviewer.
+
+        Returns:
+            Reviewer ID the task went to, or None if not assigned
+        """
+        reviewer_id = dispatcher.next_reviewer()
+        if reviewer_id is None:
+            logger.warning("No active reviewers to assign task %s", task_id)
+            return None
+        return reviewer_id if self.assign_task(task_id, reviewer_id) else None
+
+    def claim_next_task(self, reviewer_id: int, priority_filter: Optional[int] = None) -> Optional[int]:
+        """
+        Atomically take the most urgent unassigned task for a reviewer.
+
+        Uses FOR UPDATE SKIP LOCKED, so reviewers polling at the same time
+        each get a different task instead of queueing on one row lock.
+
+        Args:
+            reviewer_id: Reviewer's user ID
+            priority_filter: Optional filter by priority (1=most urgent)
+
+        Returns:
+            Claimed review task ID, or None if nothing is pending
+        """
+        if self.db is None:
+            return None
+
+        try:
+            with self.db.cursor() as cursor:
+                cursor.execute(
+                    _CLAIM_NEXT_TASK_SQL,
+                    {"reviewer_id": reviewer_id, "priority": priority_filter},
+                )
+                row = cursor.fetchone()
+            self.db.commit()
+        except Exception as e:
+            logger.error("Failed to claim task for reviewer %s: %s", reviewer_id, e)
+            self.db.rollback()
+            return None
+
+        if row is None:
+            return None
+        logger.info("Reviewer %s claimed task %s", reviewer_id, row[0])
+        return row[0]
+
     def submit_review_decision(
         self,
         review_task_id: int,
@@ -302,26 +725,85 @@ class ReviewQueue:
         Returns:
             True if stored successfully
         """
-        try:
-            logger.info(
-                f"Recording review decision for task {review_task_id}: "
-                f"decision={decision.value}, reviewer={reviewer_id}, "
-                f"confidence={reviewer_confidence}"
-            )
+        logger.info(
+            "Recording review decision for task %s: decision=%s, reviewer=%s, confidence=%s",
+            review_task_id, decision.value, reviewer_id, reviewer_confidence,
+        )
+        decision_input = ReviewDecisionInput(
+            review_task_id=review_task_id,
+            decision=decision,
+            decision_reason=decision_reason,
+            reviewer_notes=reviewer_notes,
+            reviewer_confidence=reviewer_confidence,
+            corrected_image_url=corrected_image_url,
+        )
+        return self.submit_review_decisions_bulk([decision_input], reviewer_id)
 
-            # Placeholder: Insert into review_feedback table
-            # UPDATE review_tasks SET status = ... WHERE id = review_task_id
-            # INSERT INTO review_feedback (review_task_id, reviewer_id, decision, ...) VALUES (...)
+    def submit_review_decisions_bulk(self, decisions: List[ReviewDecisionInput], reviewer_id: int) -> bool:
+        """
+        Submit several decisions by one reviewer in a single transaction.
 
-            # Mark for training if enabled
-            if decision in [ReviewDecision.ACCEPTED, ReviewDecision.REJECTED]:
-                # Could trigger async job to add to training dataset
-                logger.debug(f"Marked task {review_task_id} for potential training data capture")
+        One multi-row INSERT into review_feedback and one UPDATE of the task
+        statuses, instead of two round-trips per decision. Accepted/rejected
+        decisions are marked for training and handed to training_export on a
+        background thread, so the export never delays the reviewer.
 
+        Args:
+            decisions: Reviewer decisions
+            reviewer_id: Reviewer's user ID
+
+        Returns:
+            True if stored successfully
+        """
+        if not decisions:
             return True
+
+        feedback_rows = [
+            (
+                d.review_task_id, reviewer_id, d.decision.value, d.decision_reason,
+                d.corrected_image_url, d.reviewer_notes, d.reviewer_confidence,
+                d.decision in _TRAINING_DECISIONS,
+            )
+            for d in decisions
+        ]
+        status_rows = [(d.review_task_id, _DECISION_TASK_STATUS[d.decision].value) for d in decisions]
+
+        if self.db is not None:
+            try:
+                from psycopg2.extras import execute_values
+
+                with self.db.cursor() as cursor:
+                    execute_values(cursor, _INSERT_FEEDBACK_SQL, feedback_rows, page_size=len(feedback_rows))
+                    execute_values(cursor, _UPDATE_DECIDED_TASKS_SQL, status_rows, page_size=len(status_rows))
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.error("Failed to submit %s review decisions: %s", len(decisions), e, exc_info=True)
+                return False
+
+        training_rows = [
+            {
+                "review_task_id": d.review_task_id,
+                "reviewer_id": reviewer_id,
+                "decision": d.decision.value,
+                "reviewer_confidence": d.reviewer_confidence,
+                "corrected_image_url": d.corrected_image_url,
+            }
+            for d in decisions
+            if d.decision in _TRAINING_DECISIONS
+        ]
+        if training_rows:
+            logger.debug("Marked %s tasks for potential training data capture", len(training_rows))
+            if self.training_export is not None:
+                _training_executor().submit(self._run_training_export, training_rows)
+
+        return True
+
+    def _run_training_export(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            self.training_export(rows)
         except Exception as e:
-            logger.error(f"Failed to submit review decision: {e}", exc_info=True)
-            return False
+            logger.error("Training data export failed for %s decisions: %s", len(rows), e, exc_info=True)
 
     def get_queue_stats(self) -> Dict[str, Any]:
         """
@@ -332,16 +814,27 @@ class ReviewQueue:
         """
         try:
             logger.debug("Computing queue statistics")
-            # Placeholder: implement with SQL aggregations
+            if self.db is None:
+                return {
+                    "pending_count": 0,
+                    "in_progress_count": 0,
+                    "sla_violations": 0,
+                    "avg_review_time_minutes": 0,
+                    "high_priority_count": 0,
+                }
+
+            with self.db.cursor() as cursor:
+                cursor.execute(_QUEUE_STATS_SQL)
+                pending, in_progress, sla_violations, avg_minutes, high_priority = cursor.fetchone()
             return {
-                "pending_count": 0,
-                "in_progress_count": 0,
-                "sla_violations": 0,
-                "avg_review_time_minutes": 0,
-                "high_priority_count": 0,
+                "pending_count": pending,
+                "in_progress_count": in_progress,
+                "sla_violations": sla_violations,
+                "avg_review_time_minutes": float(avg_minutes),
+                "high_priority_count": high_priority,
             }
         except Exception as e:
-            logger.error(f"Failed to compute queue stats: {e}")
+            logger.error("Failed to compute queue stats: %s", e)
             return {}
 
     def get_reviewer_metrics(self, reviewer_id: int) -> Optional[ReviewerMetrics]:
@@ -355,11 +848,26 @@ class ReviewQueue:
             ReviewerMetrics object or None
         """
         try:
-            logger.debug(f"Computing metrics for reviewer {reviewer_id}")
-            # Placeholder
-            return None
+            logger.debug("Computing metrics for reviewer %s", reviewer_id)
+            if self.db is None:
+                return None
+
+            with self.db.cursor() as cursor:
+                cursor.execute(_REVIEWER_METRICS_SQL, {"reviewer_id": reviewer_id})
+                total, accepted, rejected, requires_edit, avg_minutes, avg_confidence = cursor.fetchone()
+            if not total:
+                return None
+            return ReviewerMetrics(
+                reviewer_id=reviewer_id,
+                total_reviewed=total,
+                accepted_count=accepted,
+                rejected_count=rejected,
+                requires_edit_count=requires_edit,
+                avg_review_time_minutes=float(avg_minutes),
+                avg_confidence=float(avg_confidence),
+            )
         except Exception as e:
-            logger.error(f"Failed to compute reviewer metrics: {e}")
+            logger.error("Failed to compute reviewer metrics: %s", e)
             return None
 
     def get_overdue_tasks(self) -> List[ReviewTask]:
@@ -371,10 +879,9 @@ class ReviewQueue:
         """
         try:
             logger.debug("Fetching overdue tasks")
-            # Placeholder
-            return []
+            return self._fetch_tasks(_OVERDUE_TASKS_SQL, {})
         except Exception as e:
-            logger.error(f"Failed to fetch overdue tasks: {e}")
+            logger.error("Failed to fetch overdue tasks: %s", e)
             return []
 
     def reassign_overdue_task(self, task_id: int, new_reviewer_id: int) -> bool:
@@ -389,11 +896,11 @@ class ReviewQueue:
             True if reassigned successfully
         """
         try:
-            logger.info(f"Reassigning overdue task {task_id} to reviewer {new_reviewer_id}")
+            logger.info("Reassigning overdue task %s to reviewer %s", task_id, new_reviewer_id)
             # Placeholder
             return True
         except Exception as e:
-            logger.error(f"Failed to reassign task {task_id}: {e}")
+            logger.error("Failed to reassign task %s: %s", task_id, e)
             return False
 
     def get_feedback_for_training(
@@ -415,13 +922,84 @@ class ReviewQueue:
             List of training samples (original_image_url, decision, reviewer_confidence, ...)
         """
         try:
-            logger.debug(f"Fetching training data (min_samples={min_samples})")
+            logger.debug("Fetching training data (min_samples=%s)", min_samples)
             # Placeholder: query review_feedback table
             return []
         except Exception as e:
-            logger.error(f"Failed to fetch training data: {e}")
+            logger.error("Failed to fetch training data: %s", e)
             return []
 
+    def _fetch_tasks(self, sql: str, params: Dict[str, Any]) -> List[ReviewTask]:
+        """
+        Run a _TASK_SELECT_SQL query and map the rows to ReviewTask objects.
+
+        Returns:
+            List of ReviewTask objects (empty without a database)
+        """
+        if self.db is None:
+            return []
+        with self.db.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [self._row_to_task(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _row_to_task(row: Tuple) -> ReviewTask:
+        """
+        Map a _TASK_SELECT_SQL row to a ReviewTask.
+
+        Vendor codes repeat across a vendor's products, so they are interned
+        (one string per distinct code); status maps to the shared enum member.
+        """
+        (task_id, task_uuid, product_id, product_image_id, product_name, vendor_code,
+         canonical_sku, image_url, validation_score, validation_checks, failure_reason,
+         status, created_at, due_by, assigned_to, priority) = row
+        return ReviewTask(
+            id=task_id,
+            task_uuid=task_uuid,
+            product_id=product_id,
+            product_image_id=product_image_id,
+            product_name=product_name or "",
+            vendor_code=sys.intern(vendor_code),
+            canonical_sku=canonical_sku,
+            image_url=image_url or "",
+            validation_score=float(validation_score or 0.0),
+            validation_checks=validation_checks or {},
+            failure_reason=failure_reason or "",
+            status=ReviewStatus(status),
+            created_at=created_at,
+            due_by=due_by,
+            assigned_to=assigned_to,
+            priority=priority,
+        )
+
+    def _priority_and_due(
+        self,
+        validation_score: float,
+        priority: Optional[int],
+        sla_hours: Optional[int],
+        now: datetime,
+    ) -> Tuple[int, datetime]:
+        """
+        Resolve a new task's priority and due date.
+
+        Returns:
+            (priority, due_by)
+        """
+        # Auto-compute priority if not specified
+        if priority is None and self.enable_priority_assignment:
+            priority = self._compute_priority(validation_score)
+        else:
+            priority = priority or 3
+
+        # Compute due date: explicit SLA, else the priority's deadline, else default
+        if sla_hours:
+            sla = timedelta(hours=sla_hours)
+        elif 0 < priority < len(_PRIORITY_DEADLINE):
+            sla = _PRIORITY_DEADLINE[priority]
+        else:
+            sla = self._default_sla
+        return priority, now + sla
+
     @staticmethod
     def _compute_priority(validation_score: float) -> int:
         """
@@ -432,18 +1010,9 @@ class ReviewQueue:
             validation_score: 0-1 validation score
             
         Returns:
-            Priority 1-5 (1=most urgent)
-        """
-        if validation_score < 0.40:
-            return 1  # Urgent
-        elif validation_score < 0.55:
-            return 2  # High
-        elif validation_score < 0.70:
-            return 3  # Normal
-        elif validation_score < 0.80:
-            return 4  # Low
-        else:
-            return 5  # Very low
+            Priority 1-5 (1=most urgent: urgent, high, normal, low, very low)
+        """
+        return bisect.bisect_right(_PRIORITY_SCORE_BOUNDS, validation_score) + 1
 
 
 # ============================================================================
@@ -485,18 +1054,21 @@ def example_review_workflow():
         },
     ]
 
-    for img in test_images:
-        task_id = queue.create_review_task(
-            product_id=img["product_id"],
-            product_image_id=img["product_image_id"],
-            product_name=img["product_name"],
-            vendor_code=img["vendor_code"],
-            canonical_sku=img["canonical_sku"],
-            image_url=img["image_url"],
-            validation_score=img["validation_score"],
-            validation_checks={},
-            failure_reason=img["reason"],
-        )
+    task_ids = queue.create_review_tasks_bulk([
+        {
+            "product_id": img["product_id"],
+            "product_image_id": img["product_image_id"],
+            "product_name": img["product_name"],
+            "vendor_code": img["vendor_code"],
+            "canonical_sku": img["canonical_sku"],
+            "image_url": img["image_url"],
+            "validation_score": img["validation_score"],
+            "validation_checks": {},
+            "failure_reason": img["reason"],
+        }
+        for img in test_images
+    ])
+    for task_id, img in zip(task_ids, test_images):
         print(f"  Task {task_id}: {img['product_name']} ({img['canonical_sku']})")
         print(f"    Score: {img['validation_score']:.2f} | Reason: {img['reason']}")
 
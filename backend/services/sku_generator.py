@@ -9,16 +9,115 @@ Key features:
 """
 
 import hashlib
-import re
+import itertools
+import math
 import string
-from typing import Tuple, Optional, Dict, Any
+import sys
+import weakref
+from functools import lru_cache
+from typing import Tuple, Optional, Dict, Any, List, Iterator
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ASCII bytes stripped from upper-cased vendor codes (everything but A-Z0-9).
+# _slugify drops non-ASCII in the ascii encode, then deletes these with one
+# bytes.translate C loop (no regex engine per product).
+_SLUG_DELETE = bytes(
+    c for c in range(128) if chr(c) not in string.ascii_uppercase + string.digits
+)
 
-class SKUStatus(Enum):
+# Base36 digit pairs, least-significant digit first: _BASE36_PAIRS[d0 + 36*d1]
+# is alphabet[d0] + alphabet[d1], so each divmod by 36**2 emits two digits.
+# Kept as bytes so the suffix is built in a bytearray and decoded once.
+_BASE36_ALPHABET = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_BASE36_PAIRS = tuple(bytes((a, b)) for b in _BASE36_ALPHABET for a in _BASE36_ALPHABET)
+
+# Server-side prepared statements: name -> (parameter types, body). Each is
+# PREPAREd once per connection (session) and then run with EXECUTE, so Postgres skips
+# parse/plan on every SKU after the first.
+_PREPARED_STATEMENTS = {
+    # Insert the first candidate SKU (in list order) not already taken, in one
+    # round-trip. A vendor code the vendor already has (unique per vendor)
+    # returns its existing SKU instead. ON CONFLICT (either constraint)
+    # covers a concurrent insert between the check and the write; the caller
+    # then retries once.
+    "sku_insert_first_free": ("text[], int, text", """
+        WITH existing AS (
+            SELECT canonical_sku FROM products WHERE vendor_id = $2 AND vendor_code = $3
+        ),
+        free AS (
+            SELECT c.sku
+            FROM unnest($1) WITH ORDINALITY AS c(sku, ord)
+            WHERE NOT EXISTS (SELECT 1 FROM products p WHERE p.canonical_sku = c.sku)
+            ORDER BY c.ord
+            LIMIT 1
+        ),
+        inserted AS (
+            INSERT INTO products (vendor_id, vendor_code, canonical_sku)
+            SELECT $2, $3, sku FROM free
+            WHERE NOT EXISTS (SELECT 1 FROM existing)
+            ON CONFLICT DO NOTHING
+            RETURNING canonical_sku
+        )
+        SELECT canonical_sku FROM inserted
+        UNION ALL
+        SELECT canonical_sku FROM existing
+    """),
+    "sku_update": ("int, text", """
+        UPDATE products SET canonical_sku = $2 WHERE id = $1
+    """),
+}
+
+
+_SKU_TAKEN_SQL = """
+SELECT EXISTS (
+    SELECT 1 FROM products
+    WHERE canonical_sku = %(sku)s
+      AND (%(exclude_id)s::int IS NULL OR id <> %(exclude_id)s::int)
+)
+"""
+
+
+class SKUBloomFilter:
+    """
+    Process-local Bloom filter over canonical SKUs.
+
+    A miss means the SKU is definitely not in the set the filter was built
+    from (plus SKUs this process inserted since); a hit may be a false
+    positive and needs the database. SKUs inserted by other processes are
+    only picked up on the next rebuild, so a miss is advisory: the unique
+    index on products.canonical_sku stays the source of truth.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Expected number of SKUs
+            error_rate: Target false-positive rate at capacity
+        """
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, sku: str) -> Iterator[int]:
+        # Double hashing (Kirsch-Mitzenmacher) from one 128-bit BLAKE2b digest
+        digest = hashlib.blake2b(sku.encode('utf8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, sku: str) -> None:
+        for pos in self._positions(sku):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, sku: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(sku))
+
+
+class SKUStatus(str, Enum):
     """Enum for SKU generation status"""
     INSERTED = "inserted"
     CONFLICT_RESOLVED = "conflict_resolved"
@@ -52,20 +151,86 @@ class SKUGenerator:
         db_connection: Any,
         max_sku_length: int = 64,
         hash_suffix_length: int = 6,
+        bloom_capacity: int = 0,
+        bloom_error_rate: float = 0.001,
     ):
         """
         Initialize SKU generator.
         
         Args:
-            db_connection: Database connection pool or connection
+            db_connection: Database connection (psycopg2), or None for mock mode
             max_sku_length: Maximum length for canonical_sku column
             hash_suffix_length: Length of deterministic suffix (e.g., "3F4E1A")
+            bloom_capacity: Size the SKU Bloom filter for this many SKUs (0 = no filter)
+            bloom_error_rate: Bloom filter false-positive rate at capacity
         """
         self.db = db_connection
         self.max_sku_length = max_sku_length
         self.hash_suffix_length = hash_suffix_length
+        # Preflight for uniqueness checks; built by refresh_sku_bloom()
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._sku_bloom: Optional[SKUBloomFilter] = None
+        self.bloom_stats = {"negative": 0, "positive": 0}
+        # Connection -> statement names already PREPAREd on it. PREPARE is
+        # session-scoped in Postgres, so a reconnect starts from nothing.
+        self._prepared: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+
+    def _execute_prepared(self, cursor: Any, name: str, args: Tuple) -> None:
+        """
+        EXECUTE a statement from _PREPARED_STATEMENTS, preparing it on first use.
+
+        (On psycopg 3, prepare_threshold=1 on the connection gives the same
+        effect automatically.)
+        """
+        prepared = self._prepared.setdefault(cursor.connection, set())
+        if name not in prepared:
+            param_types, body = _PREPARED_STATEMENTS[name]
+            cursor.execute(f"PREPARE {name} ({param_types}) AS {body}")
+            prepared.add(name)
+        placeholders = ", ".join(["%s"] * len(args))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", args)
+
+    def refresh_sku_bloom(self, fetch_size: int = 10000) -> None:
+        """
+        (Re)build the SKU Bloom filter from products.canonical_sku.
+
+        Call on startup and periodically; the new filter replaces the old one
+        in a single assignment, so concurrent lookups never see a partial one.
+        """
+        if not self.bloom_capacity:
+            return
+        bloom = SKUBloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        count = 0
+        if self.db is not None:
+            with self.db.cursor() as cursor:
+                cursor.execute("SELECT canonical_sku FROM products")
+                while rows := cursor.fetchmany(fetch_size):
+                    for (sku,) in rows:
+                        bloom.add(sku)
+                    count += len(rows)
+        self._sku_bloom = bloom
+        logger.info("SKU Bloom filter built: %s SKUs, %s bytes", count, bloom.num_bits // 8)
+
+    def _remember_sku(self, canonical_sku: str) -> None:
+        """Record a SKU this process just inserted in the Bloom filter"""
+        if self._sku_bloom is not None:
+            self._sku_bloom.add(canonical_sku)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
+    def _vendor_prefix(vendor_short: str) -> str:
+        """
+        Get the interned "<vendor_short>-" prefix for a vendor.
+
+        Bounded memo: vendor_short comes from request bodies, so an unbounded
+        cache would keep every distinct client string for the process lifetime.
+        Interned strings are released once the cache evicts them.
+        """
+        return sys.intern(vendor_short + "-")
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
     def _slugify(code: str, max_len: int = 40) -> str:
         """
         Canonicalize vendor code: uppercase, remove non-alphanumeric.
@@ -76,16 +241,18 @@ class SKUGenerator:
             
         Returns:
             Canonicalized slug (e.g., "BRIT10G")
+
+        Memoized: raw codes repeat across product variants and migration
+        retries (check _slugify.cache_info() for the hit rate).
         """
         if not code:
             return ""
         
         # Uppercase and remove non-alphanumeric
-        code = code.upper()
-        code = re.sub(r'[^A-Z0-9]+', '', code)
-        return code[:max_len]
+        return code.upper().encode('ascii', 'ignore').translate(None, _SLUG_DELETE)[:max_len].decode('ascii')
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _short_hash(value: str, length: int = 6) -> str:
         """
         Generate deterministic short hash (base36) for suffix.
@@ -96,15 +263,19 @@ class SKUGenerator:
             
         Returns:
             Uppercase hash string (e.g., "3F4E1A")
+
+        Memoized per (value, length); collision retries hash the same inputs.
         """
-        h = hashlib.sha1(value.encode('utf8')).hexdigest()
-        val = int(h[:12], 16)
-        alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        out = []
-        while len(out) < length:
-            out.append(alphabet[val % len(alphabet)])
-            val //= len(alphabet)
-        return ''.join(out)
+        # 64-bit BLAKE2b digest read straight as an int (no hex round-trip);
+        # enough for the longest (10-char) base36 suffix
+        digest = hashlib.blake2b(value.encode('utf8'), digest_size=8).digest()
+        val = int.from_bytes(digest, 'big')
+        pairs = _BASE36_PAIRS
+        out = bytearray()
+        for _ in range((length + 1) // 2):
+            val, pair = divmod(val, 1296)
+            out += pairs[pair]
+        return out[:length].decode('ascii')
 
     def generate_sku(
         self,
@@ -141,61 +312,115 @@ class SKUGenerator:
         # Step 1: Slugify
         slug = self._slugify(raw_code)
         if not slug:
-            logger.error(f"Failed to slugify raw_code: {raw_code}")
+            logger.error("Failed to slugify raw_code: %s", raw_code)
             return "", SKUStatus.ERROR
 
         # Step 2: Build candidate SKU
-        base_candidate = f"{vendor_short}-{slug}"
+        prefix = self._vendor_prefix(vendor_short)
+        base_candidate = prefix + slug
         
         # Ensure total length doesn't exceed max
         available_for_suffix = self.max_sku_length - len(base_candidate) - 1  # -1 for "-" separator
         if available_for_suffix < 0:
             # Base is too long, truncate slug
-            max_slug_len = self.max_sku_length - len(vendor_short) - 2
+            max_slug_len = self.max_sku_length - len(prefix) - 1
             slug = slug[:max_slug_len]
-            base_candidate = f"{vendor_short}-{slug}"
+            base_candidate = prefix + slug
 
-        # Step 3: Try to insert base candidate
-        try:
-            if product_id:
-                result = self._update_product_sku(product_id, base_candidate)
-            else:
-                result = self._insert_product_sku(base_candidate, vendor_id, raw_code)
-            
-            if result:
-                logger.info(f"SKU inserted successfully: {base_candidate}")
-                return base_candidate, SKUStatus.INSERTED
-        except Exception as e:
-            logger.debug(f"Insert conflict for {base_candidate}: {e}")
+        # Suffixed candidates are only hashed if the base collides
+        candidates = itertools.chain(
+            (base_candidate,),
+            self._suffixed_candidates(base_candidate, raw_code, vendor_id, max_retries),
+        )
 
-        # Step 4: Collision detected; try with deterministic suffix
-        for attempt in range(max_retries):
-            # Compute deterministic suffix based on raw_code and vendor_id
-            hash_input = f"{raw_code}:{vendor_id}:{attempt}"
-            suffix = self._short_hash(hash_input, length=min(self.hash_suffix_length + attempt, 10))
-            candidate_with_suffix = f"{base_candidate}-{suffix}"
-            
-            # Ensure length is within limit
-            if len(candidate_with_suffix) > self.max_sku_length:
-                logger.warning(f"SKU with suffix exceeds max length: {candidate_with_suffix}")
-                continue
+        # Fresh insert against a real database: pick the first free candidate
+        # server-side instead of one INSERT attempt per candidate
+        if self.db is not None and not product_id:
+            return self._insert_first_free(list(candidates), vendor_id, raw_code)
 
+        # Step 3: Try candidates in order: base first, then deterministic suffixes
+        for attempt, candidate in enumerate(candidates):
             try:
                 if product_id:
-                    result = self._update_product_sku(product_id, candidate_with_suffix)
+                    result = self._update_product_sku(product_id, candidate)
                 else:
-                    result = self._insert_product_sku(candidate_with_suffix, vendor_id, raw_code)
-                
+                    result = self._insert_product_sku(candidate, vendor_id, raw_code)
+
                 if result:
-                    logger.info(f"SKU inserted with suffix after {attempt + 1} attempt(s): {candidate_with_suffix}")
-                    return candidate_with_suffix, SKUStatus.CONFLICT_RESOLVED
+                    self._remember_sku(candidate)
+                    if attempt == 0:
+                        logger.info("SKU inserted successfully: %s", candidate)
+                        return candidate, SKUStatus.INSERTED
+                    logger.info("SKU inserted with suffix after %s attempt(s): %s", attempt, candidate)
+                    return candidate, SKUStatus.CONFLICT_RESOLVED
             except Exception as e:
-                logger.debug(f"Collision for {candidate_with_suffix}, attempt {attempt + 1}: {e}")
+                logger.debug("Collision for %s, attempt %s: %s", candidate, attempt, e)
                 continue
 
-        logger.error(f"Failed to generate unique SKU after {max_retries} retries for {raw_code}")
+        logger.error("Failed to generate unique SKU after %s retries for %s", max_retries, raw_code)
         return "", SKUStatus.CONFLICT_UNRESOLVED
 
+    def _suffixed_candidates(
+        self, base_candidate: str, raw_code: str, vendor_id: int, max_retries: int
+    ) -> Iterator[str]:
+        """
+        Deterministic collision candidates "<base>-<hash>", one per retry, with
+        the suffix growing a character per attempt. Candidates over
+        max_sku_length are skipped.
+        """
+        # Deterministic suffix based on raw_code and vendor_id; only the
+        # attempt number changes between retries
+        hash_prefix = f"{raw_code}:{vendor_id}:"
+        for attempt in range(max_retries):
+            suffix = self._short_hash(hash_prefix + str(attempt), length=min(self.hash_suffix_length + attempt, 10))
+            candidate_with_suffix = f"{base_candidate}-{suffix}"
+
+            # Ensure length is within limit
+            if len(candidate_with_suffix) > self.max_sku_length:
+                logger.warning("SKU with suffix exceeds max length: %s", candidate_with_suffix)
+                continue
+            yield candidate_with_suffix
+
+    def _insert_first_free(
+        self, candidates: List[str], vendor_id: int, raw_code: str
+    ) -> Tuple[str, SKUStatus]:
+        """
+        Insert the product with the first candidate SKU that isn't taken,
+        in a single statement.
+
+        Returns:
+            Tuple of (canonical_sku, status), as generate_sku
+        """
+        args = (candidates, vendor_id, raw_code)
+        try:
+            # Second pass only if a concurrent insert took our pick in between
+            for _ in range(2):
+                with self.db.cursor() as cursor:
+                    self._execute_prepared(cursor, "sku_insert_first_free", args)
+                    row = cursor.fetchone()
+                self.db.commit()
+                if row is not None:
+                    break
+        except Exception as e:
+            self.db.rollback()
+            logger.error("SKU insert failed for %s: %s", raw_code, e)
+            return "", SKUStatus.ERROR
+
+        if row is None:
+            logger.error(
+                "Failed to generate unique SKU: all %s candidates taken for %s",
+                len(candidates), raw_code,
+            )
+            return "", SKUStatus.CONFLICT_UNRESOLVED
+
+        canonical_sku = row[0]
+        self._remember_sku(canonical_sku)
+        if canonical_sku == candidates[0]:
+            logger.info("SKU inserted successfully: %s", canonical_sku)
+            return canonical_sku, SKUStatus.INSERTED
+        logger.info("SKU inserted with suffix: %s", canonical_sku)
+        return canonical_sku, SKUStatus.CONFLICT_RESOLVED
+
     def _insert_product_sku(self, canonical_sku: str, vendor_id: int, raw_code: str) -> bool:
         """
         Attempt to insert product with canonical_sku.
@@ -225,7 +450,7 @@ class SKUGenerator:
         # self.db.commit()
         # return True
         
-        logger.debug(f"[MOCK] Inserting SKU: {canonical_sku} for vendor_id={vendor_id}")
+        logger.debug("[MOCK] Inserting SKU: %s for vendor_id=%s", canonical_sku, vendor_id)
         return True
 
     def _update_product_sku(self, product_id: int, canonical_sku: str) -> bool:
@@ -242,8 +467,19 @@ class SKUGenerator:
         Raises:
             Exception: If unique constraint violated or DB error
         """
-        logger.debug(f"[MOCK] Updating product {product_id} SKU to: {canonical_sku}")
-        return True
+        if self.db is None:
+            logger.debug("[MOCK] Updating product %s SKU to: %s", product_id, canonical_sku)
+            return True
+
+        try:
+            with self.db.cursor() as cursor:
+                self._execute_prepared(cursor, "sku_update", (product_id, canonical_sku))
+                updated = cursor.rowcount == 1
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return updated
 
     def validate_sku_uniqueness(self, canonical_sku: str, exclude_product_id: Optional[int] = None) -> bool:
         """
@@ -256,9 +492,23 @@ class SKUGenerator:
         Returns:
             True if unique (can be used), False if already exists
         """
-        # Placeholder for actual DB query
-        logger.debug(f"[MOCK] Checking uniqueness of {canonical_sku}")
-        return True
+        # Bloom miss: not in the table as of the last rebuild; skip the query.
+        # Advisory only; the unique index still rejects a racing insert.
+        bloom = self._sku_bloom
+        if bloom is not None:
+            if canonical_sku not in bloom:
+                self.bloom_stats["negative"] += 1
+                return True
+            self.bloom_stats["positive"] += 1
+
+        if self.db is None:
+            logger.debug("[MOCK] Checking uniqueness of %s", canonical_sku)
+            return True
+
+        with self.db.cursor() as cursor:
+            cursor.execute(_SKU_TAKEN_SQL, {"sku": canonical_sku, "exclude_id": exclude_product_id})
+            (taken,) = cursor.fetchone()
+        return not taken
 
     def list_sku_collisions(self, vendor_id: Optional[int] = None) -> list:
         """
@@ -272,7 +522,7 @@ class SKUGenerator:
             List of collision groups
         """
         # Placeholder
-        logger.debug(f"[MOCK] Listing SKU collisions for vendor_id={vendor_id}")
+        logger.debug("[MOCK] Listing SKU collisions for vendor_id=%s", vendor_id)
         return []
 
     def migrate_legacy_codes(self, batch_size: int = 100) -> Dict[str, Any]:
@@ -287,7 +537,7 @@ class SKUGenerator:
         Returns:
             Migration statistics (processed, errors, collisions)
         """
-        logger.info(f"Starting migration of legacy product codes")
+        logger.info("Starting migration of legacy product codes")
         stats = {
             "processed": 0,
             "migrated": 0,
@@ -296,7 +546,7 @@ class SKUGenerator:
         }
         
         # Placeholder: fetch legacy products, generate SKUs, batch insert
-        logger.info(f"Migration complete: {stats}")
+        logger.info("Migration complete: %s", stats)
         return stats
 
 
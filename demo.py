@@ -3,17 +3,37 @@
 Demo script: Run end-to-end examples of SKU generation and image validation
 """
 
+import contextlib
+import functools
+import io
 import sys
 import os
 
+import numpy as np
+
 # Add backend to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from backend.services.sku_generator import SKUGenerator, SKUStatus
-from backend.services.image_validator import ImageValidator, ValidationStatus
+from backend.services.image_validator import CHECK_NAMES, ImageValidator, ValidationStatus
 from backend.services.review_queue import ReviewQueue, ReviewDecision
 
 
+def _buffered_output(demo):
+    """Collect a demo's prints in memory and write them to stdout in one call"""
+    @functools.wraps(demo)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return demo(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@_buffered_output
 def demo_sku_generation():
     """Demo: Unique SKU generation for multi-vendor scenario"""
     print("\n" + "=" * 80)
@@ -58,6 +78,7 @@ def demo_sku_generation():
     print(f"  Vendor prefix prevents collisions: {sku1.split('-')[0] != sku3.split('-')[0]}")
 
 
+@_buffered_output
 def demo_image_validation():
     """Demo: Image validation with human-in-the-loop"""
     print("\n" + "=" * 80)
@@ -72,79 +93,45 @@ def demo_image_validation():
         review_score_threshold=0.70,
     )
 
-    # Test scenarios
-    scenarios = [
-        {
-            "name": "Perfect Product Image",
-            "scores": {
-                "background_white": 0.98,
-                "blur": 0.95,
-                "object_coverage": 0.85,
-                "object_detection": 0.92,
-                "perceptual_similarity": 0.98,
-            },
-            "expected": "auto_accepted",
-        },
-        {
-            "name": "Slightly Imperfect Image",
-            "scores": {
-                "background_white": 0.88,
-                "blur": 0.80,
-                "object_coverage": 0.75,
-                "object_detection": 0.80,
-                "perceptual_similarity": 0.82,
-            },
-            "expected": "needs_review",
-        },
-        {
-            "name": "Poor Quality Image",
-            "scores": {
-                "background_white": 0.40,
-                "blur": 0.50,
-                "object_coverage": 0.20,
-                "object_detection": 0.55,
-                "perceptual_similarity": 0.45,
-            },
-            "expected": "auto_rejected",
-        },
-    ]
-
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"{i}. {scenario['name']}")
-        
-        # Compute weighted score
-        overall_score = (
-            validator.weights["background_white"] * scenario["scores"]["background_white"]
-            + validator.weights["blur"] * scenario["scores"]["blur"]
-            + validator.weights["object_coverage"] * scenario["scores"]["object_coverage"]
-            + validator.weights["object_detection"] * scenario["scores"]["object_detection"]
-            + validator.weights["perceptual_similarity"] * scenario["scores"]["perceptual_similarity"]
-        )
-
-        # Determine status
-        if overall_score >= validator.accept_score_threshold:
-            status = ValidationStatus.AUTO_ACCEPTED
-        elif overall_score >= validator.review_score_threshold:
-            status = ValidationStatus.NEEDS_REVIEW
-        else:
-            status = ValidationStatus.AUTO_REJECTED
-
-        print(f"   Background white: {scenario['scores']['background_white']:.2f}")
-        print(f"   Blur: {scenario['scores']['blur']:.2f}")
-        print(f"   Object coverage: {scenario['scores']['object_coverage']:.2f}")
-        print(f"   Object detection: {scenario['scores']['object_detection']:.2f}")
-        print(f"   Perceptual similarity: {scenario['scores']['perceptual_similarity']:.2f}")
+    # Test scenarios: one record per image, one float64 field per check (CHECK_NAMES order)
+    score_dtype = np.dtype([(name, np.float64) for name in CHECK_NAMES])
+    names = ["Perfect Product Image", "Slightly Imperfect Image", "Poor Quality Image"]
+    expected = ["auto_accepted", "needs_review", "auto_rejected"]
+    scenario_scores = np.array([
+        # background_white, blur, object_coverage, object_detection, perceptual_similarity
+        (0.98, 0.95, 0.85, 0.92, 0.98),
+        (0.88, 0.80, 0.75, 0.80, 0.82),
+        (0.40, 0.50, 0.20, 0.55, 0.45),
+    ], dtype=score_dtype)
+
+    # Weighted scores and decisions for every scenario at once; the validator
+    # takes a (checks, scenarios) matrix, i.e. the transposed plain-float view
+    matrix = scenario_scores.view((np.float64, len(CHECK_NAMES))).T
+    overall_scores, decisions = validator.score_batch(matrix)
+
+    for i, (name, scores, overall_score, decision, want) in enumerate(
+        zip(names, scenario_scores, overall_scores.tolist(), decisions.tolist(), expected), 1
+    ):
+        print(f"{i}. {name}")
+        status = validator.DECISION_STATUS[decision]
+
+        print(f"   Background white: {scores['background_white']:.2f}")
+        print(f"   Blur: {scores['blur']:.2f}")
+        print(f"   Object coverage: {scores['object_coverage']:.2f}")
+        print(f"   Object detection: {scores['object_detection']:.2f}")
+        print(f"   Perceptual similarity: {scores['perceptual_similarity']:.2f}")
         print(f"   ─────────────────────────")
         print(f"   Overall score: {overall_score:.2f}")
         print(f"   Status: {status.value.upper()}")
         
-        if status.value != scenario["expected"]:
-            print(f"   ⚠️ Expected: {scenario['expected']}")
+        if status.value != want:
+            print(f"   ⚠️ Expected: {want}")
         else:
             print(f"   ✓ Correct decision")
         print()
 
 
+@_buffered_output
 def demo_human_review_workflow():
     """Demo: Human review workflow and feedback capture"""
     print("\n" + "=" * 80)
@@ -215,6 +202,7 @@ def demo_human_review_workflow():
     print("✓ Image status updated\n")
 
 
+@_buffered_output
 def demo_integration_example():
     """Demo: Full integration example"""
     print("\n" + "=" * 80)
@@ -271,10 +259,12 @@ def demo_integration_example():
 
 def main():
     """Run all demos"""
-    print("\n" + "█" * 80)
-    print("█  SKU & Image Validation Pipeline - Interactive Demo")
-    print("█  Version 1.0")
-    print("█" * 80)
+    sys.stdout.write(
+        "\n" + "█" * 80 + "\n"
+        "█  SKU & Image Validation Pipeline - Interactive Demo\n"
+        "█  Version 1.0\n"
+        + "█" * 80 + "\n"
+    )
 
     try:
         demo_sku_generation()
@@ -282,21 +272,23 @@ def main():
         demo_human_review_workflow()
         demo_integration_example()
 
-        print("\n" + "=" * 80)
-        print("DEMO COMPLETE")
-        print("=" * 80)
-        print("\nNext Steps:")
-        print("1. Review the code in backend/services/")
-        print("2. Review database schema in backend/migrations/001_initial_schema.sql")
-        print("3. Start API server: python backend/main.py")
-        print("4. Explore API endpoints at http://localhost:8000/docs")
-        print("5. Run tests: pytest tests/ -v")
-        print("6. Deploy reviewer UI from frontend/")
-        print("\nDocumentation:")
-        print("  - README.md: Project overview")
-        print("  - INTEGRATION_GUIDE.md: Integration steps")
-        print("  - backend/config.py: Configuration options")
-        print("\n" + "=" * 80 + "\n")
+        sys.stdout.writelines(line + "\n" for line in (
+            "\n" + "=" * 80,
+            "DEMO COMPLETE",
+            "=" * 80,
+            "\nNext Steps:",
+            "1. Review the code in backend/services/",
+            "2. Review database schema in backend/migrations/001_initial_schema.sql",
+            "3. Start API server: python backend/main.py",
+            "4. Explore API endpoints at http://localhost:8000/docs",
+            "5. Run tests: pytest tests/ -v",
+            "6. Deploy reviewer UI from frontend/",
+            "\nDocumentation:",
+            "  - README.md: Project overview",
+            "  - INTEGRATION_GUIDE.md: Integration steps",
+            "  - backend/config.py: Configuration options",
+            "\n" + "=" * 80 + "\n",
+        ))
 
     except Exception as e:
         print(f"\n❌ Error running demo: {e}")
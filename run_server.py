@@ -3,57 +3,234 @@ SKU Image Pipeline - Backend Server with Authentication
 """
 import sys
 import os
+import asyncio
 import base64
 import hashlib
+import heapq
+import hmac
+import logging
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import count, islice
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Literal
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+import jwt
 import uvicorn
 from pydantic import BaseModel
 from enum import Enum
 
 from backend.services.sku_generator import SKUGenerator
 from backend.services.image_validator import ImageValidator
+from backend.services.object_detector import load_detector
 from backend.services.review_queue import ReviewQueue
+from backend.responses import ORJSONResponse
 import backend.config as config
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
 
 # Create app
 app = FastAPI(
     title="Catalyze - Image Review Platform",
     version="2.0.0",
-    description="Product image review and approval platform with vendor workflow"
+    description="Product image review and approval platform with vendor workflow",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS (terminated at the reverse proxy in production)
+if not config.CORS_HANDLED_BY_PROXY:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=config.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# Compress JSON bodies >= 1 KB (queue listings); small ones like /health pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 security = HTTPBearer(auto_error=False)
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # In-Memory Storage (for demo - use database in production)
 # ============================================================================
 
 users_db: Dict[str, Dict] = {}
-tokens_db: Dict[str, str] = {}  # token -> email
-submissions_db: List[Dict] = []
-submission_counter = 0
-review_tasks: List[Dict] = []
-task_counter = 0
+# jti -> exp, for logged-out tokens not yet expired. Per process: a logout is
+# only honoured by the worker that served it, and is forgotten on restart.
+revoked_token_ids: Dict[str, float] = {}
+
+# One record per review task, keyed by task id. A vendor upload is a single
+# record carrying both its task and submission fields (submission_id,
+# filename); the vendor-facing submission is a projection of it.
+records: Dict[int, Dict] = {}
+review_tasks: List[int] = []    # task ids, in creation order
+submissions_db: List[int] = []  # task ids of records that came from uploads
+_submission_ids = count(1)  # next() is atomic; no global rebinding
+_task_ids = count(1)
+
+# Secondary indexes over the records (kept in step by the helpers below)
+submissions_by_vendor: Dict[str, List[int]] = defaultdict(list)
+pending_tasks: deque = deque()
+pending_tasks_by_priority: Dict[int, deque] = defaultdict(deque)
+completed_tasks: List[Dict] = []
+
+# Running queue statistics (updated on state transitions, read by /review/stats)
+REVIEW_SLA_SECONDS = 48 * 3600
+decision_counts: Counter = Counter()
+sum_review_seconds = 0.0
+n_reviewed = 0
+sla_heap: List[tuple] = []  # (due_by_ts, task_id) for tasks that were pending when pushed
+overdue_task_ids: set = set()
+
+
+@lru_cache(maxsize=256)
+def _iso_second(epoch_s: int) -> str:
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+
+def iso_ts(ts: float) -> str:
+    """
+    ISO-8601 string for an epoch timestamp, to the second.
+
+    Formatting is memoized per whole second, so a burst of writes shares
+    one datetime + format instead of building one per field per request.
+    """
+    return _iso_second(int(ts))
+
+
+def _submission_view(record: Dict) -> Dict:
+    """Vendor-facing submission fields of an upload record"""
+    return {
+        "id": record["submission_id"],
+        "vendor_email": record["vendor_email"],
+        "vendor_name": record["vendor_name"],
+        "product_name": record["product_name"],
+        "vendor_code": record["vendor_code"],
+        "filename": record["filename"],
+        "image_url": record["image_url"],
+        "status": record["status"],
+        "feedback": record["feedback"],
+        "reviewed_by": record.get("reviewed_by"),
+        "created_at": record["created_at"],
+        "reviewed_at": record.get("reviewed_at"),
+    }
+
+
+# Reviewer-facing task fields, in response order. Upload-only (submission_id)
+# and decision fields are included once a record has them; the epoch *_ts
+# bookkeeping and the stored filename stay internal.
+_TASK_FIELDS = (
+    "id", "submission_id", "product_id", "product_image_id", "product_name",
+    "vendor_code", "vendor_name", "vendor_email", "canonical_sku", "image_url",
+    "validation_score", "validation_checks", "failure_reason", "priority",
+    "status", "feedback", "created_at", "due_by",
+    "reviewed_by", "reviewer_notes", "reviewer_confidence", "reviewed_at",
+)
+
+
+def _task_view(record: Dict) -> Dict:
+    """Reviewer-facing fields of a task record"""
+    return {field: record[field] for field in _TASK_FIELDS if field in record}
+
+
+# Write-behind commit log: endpoints enqueue new records and return; a
+# background consumer applies whatever arrived within one batch window.
+# Readers flush first, so a request always sees its own earlier writes.
+COMMIT_BATCH_WINDOW_SECS = 0.01
+commit_queue: asyncio.Queue = asyncio.Queue()
+_commit_ready = asyncio.Event()
+_commit_consumer: Optional[asyncio.Task] = None
+
+
+def _enqueue_commit(record: Dict) -> None:
+    """Queue a new record for the next batch"""
+    commit_queue.put_nowait(record)
+    _commit_ready.set()
+
+
+def _flush_commit_log() -> int:
+    """
+    Apply every queued record: one bulk update/extend per store, then the indexes.
+
+    Returns:
+        Number of records applied
+    """
+    batch = []
+    while True:
+        try:
+            batch.append(commit_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+        commit_queue.task_done()
+    if not batch:
+        return 0
+
+    records.update((rec["id"], rec) for rec in batch)
+    review_tasks.extend(rec["id"] for rec in batch)
+    uploads = [rec for rec in batch if "submission_id" in rec]
+    submissions_db.extend(rec["id"] for rec in uploads)
+
+    for rec in uploads:
+        submissions_by_vendor[rec["vendor_email"]].append(rec["id"])
+    for rec in batch:
+        pending_tasks.append(rec)
+        pending_tasks_by_priority[rec["priority"]].append(rec)
+        heapq.heappush(sla_heap, (rec["due_by_ts"], rec["id"]))
+
+    return len(batch)
+
+
+async def _run_commit_log() -> None:
+    """Background consumer: wait for writes, let a batch gather, apply it"""
+    while True:
+        await _commit_ready.wait()
+        await asyncio.sleep(COMMIT_BATCH_WINDOW_SECS)
+        _commit_ready.clear()
+        _flush_commit_log()
+
+
+def _complete_task(task: Dict, decision: str, reviewed_ts: float) -> None:
+    """
+    Record a decision on a task: move it out of the pending indexes and
+    update the running statistics (a re-decision replaces the old one).
+    """
+    global sum_review_seconds, n_reviewed
+
+    if task["status"] == "pending":
+        pending_tasks.remove(task)
+        pending_tasks_by_priority[task["priority"]].remove(task)
+        overdue_task_ids.discard(task["id"])
+        completed_tasks.append(task)
+        n_reviewed += 1
+    else:
+        decision_counts[task["status"]] -= 1
+        sum_review_seconds -= task["reviewed_ts"] - task["created_ts"]
+
+    decision_counts[decision] += 1
+    sum_review_seconds += reviewed_ts - task["created_ts"]
+
+
+def _count_sla_violations(now_ts: float) -> int:
+    """Move newly expired pending tasks off the deadline heap; return how many are overdue"""
+    while sla_heap and sla_heap[0][0] < now_ts:
+        _, task_id = heapq.heappop(sla_heap)
+        if records[task_id]["status"] == "pending":
+            overdue_task_ids.add(task_id)
+    return len(overdue_task_ids)
 
 # Global services
 sku_generator = None
@@ -96,7 +273,8 @@ class CreateReviewTaskRequest(BaseModel):
 
 class SubmitReviewDecisionRequest(BaseModel):
     review_task_id: int
-    decision: str
+    # Terminal states only: "pending" would leave a completed task looking open
+    decision: Literal["accepted", "rejected", "requires_edit"]
     reviewer_id: int
     reviewer_notes: Optional[str] = None
     reviewer_confidence: int = 5
@@ -107,22 +285,115 @@ class SubmitReviewDecisionRequest(BaseModel):
 # Auth Helpers
 # ============================================================================
 
-def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+# scrypt work factors (~16 MiB, tens of ms per hash; OWASP minimum is N=2**14)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+# Repeat logins skip the KDF: email -> (sha256 of password, stored hash it matched)
+VERIFIED_LOGIN_CACHE_SIZE = 4096
+_verified_logins: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> Dict[str, bytes]:
+    """
+    Derive a password hash with scrypt (native, releases the GIL).
+
+    Args:
+        password: Plain-text password
+        salt: Per-user salt; a fresh 16-byte one is drawn when omitted
+
+    Returns:
+        {"salt": ..., "hash": ...} to store on the user record
+    """
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.scrypt(
+        password.encode(), salt=salt,
+        n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=SCRYPT_DKLEN,
+    )
+    return {"salt": salt, "hash": digest}
+
+
+async def verify_password(user: Dict, password: str) -> bool:
+    """
+    Check a password against a user record.
 
+    A successful check is remembered per email (keyed by the password's
+    SHA-256, and tied to the stored hash so a password change invalidates
+    it), so repeat logins are a dict lookup instead of a KDF run.
+    """
+    email = user["email"]
+    pw_digest = hashlib.sha256(password.encode()).digest()
+    stored = user["password"]["hash"]
 
-def generate_token() -> str:
-    return secrets.token_urlsafe(32)
+    cached = _verified_logins.get(email)
+    if cached is not None and hmac.compare_digest(cached[0], pw_digest) and cached[1] is stored:
+        _verified_logins.move_to_end(email)
+        return True
+
+    # Keep the KDF off the event loop thread
+    candidate = await run_in_threadpool(hash_password, password, user["password"]["salt"])
+    if not hmac.compare_digest(candidate["hash"], stored):
+        return False
+
+    _verified_logins[email] = (pw_digest, stored)
+    _verified_logins.move_to_end(email)
+    if len(_verified_logins) > VERIFIED_LOGIN_CACHE_SIZE:
+        _verified_logins.popitem(last=False)
+    return True
+
+
+def forget_verified_login(email: str) -> None:
+    """Drop the cached login check for a user (logout / password change)"""
+    _verified_logins.pop(email, None)
+
+
+# Stateless HS256 bearer tokens; any worker sharing AUTH_SECRET_KEY can verify
+# them. Unset, each process signs with its own random key, so tokens fail on
+# other workers and after a restart (startup warns outside DEBUG).
+AUTH_SECRET = config.AUTH_SECRET_KEY or secrets.token_urlsafe(48)
+AUTH_ALGORITHM = "HS256"
+
+
+def generate_token(email: str) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": email,
+        "iat": now,
+        "exp": now + config.AUTH_TOKEN_TTL_SECONDS,
+        "jti": secrets.token_hex(8),
+    }
+    return jwt.encode(payload, AUTH_SECRET, algorithm=AUTH_ALGORITHM)
+
+
+def decode_token(token: str) -> Optional[Dict]:
+    """Verified token claims, or None if the token is invalid, expired or logged out"""
+    try:
+        payload = jwt.decode(token, AUTH_SECRET, algorithms=[AUTH_ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+    if payload.get("jti") in revoked_token_ids:
+        return None
+    return payload
+
+
+def revoke_token(payload: Dict) -> None:
+    """Deny a token until it expires; entries whose tokens have expired are pruned"""
+    now = time.time()
+    for jti in [j for j, exp in revoked_token_ids.items() if exp <= now]:
+        del revoked_token_ids[jti]
+    revoked_token_ids[payload["jti"]] = payload["exp"]
 
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Optional[Dict]:
     if not credentials:
         return None
-    token = credentials.credentials
-    email = tokens_db.get(token)
-    if email and email in users_db:
-        return users_db[email]
-    return None
+    payload = decode_token(credentials.credentials)
+    if payload is None:
+        return None
+    return users_db.get(payload["sub"])
 
 
 async def require_auth(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict:
@@ -159,14 +430,13 @@ async def register(request: RegisterRequest):
     users_db[request.email] = {
         "name": request.name,
         "email": request.email,
-        "password": hash_password(request.password),
+        "password": await run_in_threadpool(hash_password, request.password),
         "role": request.role.value,
-        "created_at": datetime.now().isoformat(),
+        "created_at": iso_ts(time.time()),
     }
     
     # Auto-login after registration
-    token = generate_token()
-    tokens_db[token] = request.email
+    token = generate_token(request.email)
     
     return {
         "message": "Registration successful",
@@ -183,11 +453,10 @@ async def register(request: RegisterRequest):
 async def login(request: LoginRequest):
     """Login user"""
     user = users_db.get(request.email)
-    if not user or user["password"] != hash_password(request.password):
+    if not user or not await verify_password(user, request.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    token = generate_token()
-    tokens_db[token] = request.email
+    token = generate_token(request.email)
     
     return {
         "message": "Login successful",
@@ -213,8 +482,10 @@ async def get_me(user: Dict = Depends(require_auth)):
 @app.post("/api/v1/auth/logout")
 async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Logout user"""
-    if credentials and credentials.credentials in tokens_db:
-        del tokens_db[credentials.credentials]
+    payload = decode_token(credentials.credentials) if credentials else None
+    if payload is not None:
+        revoke_token(payload)
+        forget_verified_login(payload["sub"])
     return {"message": "Logged out"}
 
 
@@ -226,6 +497,80 @@ async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
 UPLOAD_DIR = os.path.join(project_root, "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+MAX_UPLOAD_BYTES = config.IMAGE_MAX_SIZE_MB * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+# blake2b-128 of stored upload bytes -> filename they were first stored under.
+# Byte-identical re-uploads (vendor retries) reuse that file instead of a copy.
+uploads_by_digest: Dict[bytes, str] = {}
+
+# Accepted upload content types -> stored file extension
+_EXT_MAP = {"image/jpeg": "jpg", "image/png": "png"}
+
+
+@lru_cache(maxsize=8192)
+def canonical_sku(vendor_code: str) -> str:
+    """Demo canonical SKU for a vendor code: first four chars, dash, full code (upper-cased)"""
+    upper = vendor_code.upper()
+    return f"{upper[:4]}-{upper}"
+
+
+def _digest_upload(src, max_bytes: int) -> bytes:
+    """
+    Hash an upload in fixed-size chunks and rewind it (runs in the threadpool).
+
+    Raises:
+        ValueError: If the stream exceeds max_bytes
+    """
+    h = hashlib.blake2b(digest_size=16)
+    read = 0
+    while chunk := src.read(UPLOAD_CHUNK_BYTES):
+        read += len(chunk)
+        if read > max_bytes:
+            raise ValueError(f"upload exceeds {max_bytes} bytes")
+        h.update(chunk)
+    src.seek(0)
+    return h.digest()
+
+
+def _save_upload(src, filepath: str, max_bytes: int, size_hint: Optional[int] = None) -> int:
+    """
+    Copy an upload to disk in fixed-size chunks (runs in the threadpool).
+
+    When the size is known up front the file is preallocated with
+    posix_fallocate, so the filesystem lays out one extent instead of
+    growing the file write by write.
+
+    Returns:
+        Bytes written
+
+    Raises:
+        ValueError: If the stream exceeds max_bytes (the partial file is removed)
+    """
+    written = 0
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if size_hint and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, min(size_hint, max_bytes))
+            except OSError:
+                pass  # filesystem without fallocate support; plain writes still work
+        while chunk := src.read(UPLOAD_CHUNK_BYTES):
+            written += len(chunk)
+            if written > max_bytes:
+                break
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        if size_hint and written < size_hint:
+            os.ftruncate(fd, written)  # release preallocation the stream didn't fill
+    finally:
+        os.close(fd)
+    if written > max_bytes:
+        os.remove(filepath)
+        raise ValueError(f"upload exceeds {max_bytes} bytes")
+    return written
+
 
 @app.post("/api/v1/images/upload")
 async def upload_image(
@@ -235,51 +580,41 @@ async def upload_image(
     user: Dict = Depends(require_vendor),
 ):
     """Vendor uploads an image for review"""
-    global submission_counter, task_counter
-    
     # Validate file type
-    if not file.content_type in ["image/jpeg", "image/png"]:
+    ext = _EXT_MAP.get(file.content_type)
+    if ext is None:
         raise HTTPException(status_code=400, detail="Only JPG/PNG images allowed")
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Image exceeds {config.IMAGE_MAX_SIZE_MB} MB")
     
-    # Save file
-    submission_counter += 1
-    ext = "jpg" if "jpeg" in file.content_type else "png"
-    filename = f"submission_{submission_counter}.{ext}"
-    filepath = os.path.join(UPLOAD_DIR, filename)
-    
-    content = await file.read()
-    with open(filepath, "wb") as f:
-        f.write(content)
-    
-    # Create submission record
-    submission = {
-        "id": submission_counter,
-        "vendor_email": user["email"],
-        "vendor_name": user["name"],
-        "product_name": product_name,
-        "vendor_code": vendor_code,
-        "filename": filename,
-        "image_url": f"/uploads/{filename}",
-        "status": "pending",
-        "feedback": None,
-        "reviewed_by": None,
-        "created_at": datetime.now().isoformat(),
-        "reviewed_at": None,
-    }
-    submissions_db.append(submission)
+    # Hash the spooled upload, then save it unless identical bytes are stored already.
+    # Both stream it off the event loop in fixed-size chunks (constant memory).
+    try:
+        digest = await run_in_threadpool(_digest_upload, file.file, MAX_UPLOAD_BYTES)
+        filename = uploads_by_digest.get(digest)
+        now_ts = time.time()
+        submission_id = next(_submission_ids)
+        if filename is None:
+            filename = f"submission_{submission_id}.{ext}"
+            filepath = os.path.join(UPLOAD_DIR, filename)
+            await run_in_threadpool(_save_upload, file.file, filepath, MAX_UPLOAD_BYTES, file.size)
+            uploads_by_digest[digest] = filename
+    except ValueError:
+        raise HTTPException(status_code=413, detail=f"Image exceeds {config.IMAGE_MAX_SIZE_MB} MB")
     
-    # Also create a review task
-    task_counter += 1
+    # One record is both the review task and the vendor's submission
+    task_id = next(_task_ids)
     task = {
-        "id": task_counter,
-        "submission_id": submission_counter,
-        "product_id": submission_counter,
-        "product_image_id": submission_counter,
+        "id": task_id,
+        "submission_id": submission_id,
+        "filename": filename,
+        "product_id": submission_id,
+        "product_image_id": submission_id,
         "product_name": product_name,
         "vendor_code": vendor_code,
         "vendor_name": user["name"],
         "vendor_email": user["email"],
-        "canonical_sku": f"{vendor_code.upper()[:4]}-{vendor_code.upper()}",
+        "canonical_sku": canonical_sku(vendor_code),
         "image_url": f"/uploads/{filename}",
         "validation_score": 0.70,  # Default pending score
         "validation_checks": {
@@ -292,14 +627,16 @@ async def upload_image(
         "priority": 3,
         "status": "pending",
         "feedback": None,
-        "created_at": datetime.now().isoformat(),
-        "due_by": (datetime.now() + timedelta(hours=48)).isoformat(),
+        "created_at": iso_ts(now_ts),
+        "created_ts": now_ts,
+        "due_by": iso_ts(now_ts + REVIEW_SLA_SECONDS),
+        "due_by_ts": now_ts + REVIEW_SLA_SECONDS,
     }
-    review_tasks.append(task)
+    _enqueue_commit(task)
     
     return {
         "message": "Image uploaded successfully",
-        "submission_id": submission_counter,
+        "submission_id": submission_id,
         "status": "pending",
     }
 
@@ -307,10 +644,12 @@ async def upload_image(
 @app.get("/api/v1/images/my-submissions")
 async def get_my_submissions(user: Dict = Depends(require_vendor)):
     """Get vendor's own submissions"""
-    my_subs = [s for s in submissions_db if s["vendor_email"] == user["email"]]
+    _flush_commit_log()
+    my_ids = submissions_by_vendor.get(user["email"], [])
     return {
-        "count": len(my_subs),
-        "submissions": sorted(my_subs, key=lambda x: x["id"], reverse=True),
+        "count": len(my_ids),
+        # appended in id order; newest first
+        "submissions": [_submission_view(records[task_id]) for task_id in reversed(my_ids)],
     }
 
 
@@ -330,24 +669,24 @@ async def get_pending_review_tasks(
     user: Dict = Depends(require_official),
 ):
     """Get pending review tasks (officials only)"""
-    pending = [t for t in review_tasks if t["status"] == "pending"]
-    
-    if priority:
-        pending = [t for t in pending if t["priority"] == priority]
+    _flush_commit_log()
+    source = pending_tasks_by_priority.get(priority, ()) if priority else pending_tasks
+    pending = list(islice(source, max(limit, 0)))
     
     return {
-        "task_count": len(pending[:limit]),
-        "tasks": pending[:limit]
+        "task_count": len(pending),
+        "tasks": [_task_view(task) for task in pending]
     }
 
 
 @app.get("/api/v1/review/task/{task_id}")
 async def get_review_task(task_id: int, user: Dict = Depends(require_official)):
     """Get specific review task"""
-    for task in review_tasks:
-        if task["id"] == task_id:
-            return task
-    raise HTTPException(status_code=404, detail="Task not found")
+    _flush_commit_log()
+    task = records.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return _task_view(task)
 
 
 @app.post("/api/v1/review/submit-decision")
@@ -356,68 +695,43 @@ async def submit_review_decision(
     user: Dict = Depends(require_official),
 ):
     """Submit reviewer's decision with feedback"""
-    for task in review_tasks:
-        if task["id"] == request.review_task_id:
-            task["status"] = request.decision
-            task["reviewed_by"] = user["name"]
-            task["reviewer_notes"] = request.reviewer_notes
-            task["feedback"] = request.feedback_message or request.reviewer_notes
-            task["reviewer_confidence"] = request.reviewer_confidence
-            task["reviewed_at"] = datetime.now().isoformat()
-            
-            # Update corresponding submission
-            for sub in submissions_db:
-                if sub["id"] == task.get("submission_id"):
-                    sub["status"] = request.decision
-                    sub["feedback"] = request.feedback_message or request.reviewer_notes
-                    sub["reviewed_by"] = user["name"]
-                    sub["reviewed_at"] = datetime.now().isoformat()
-                    break
-            
-            return {
-                "task_id": request.review_task_id,
-                "decision": request.decision,
-                "status": "recorded",
-                "message": "Decision recorded and vendor notified"
-            }
+    _flush_commit_log()
+    task = records.get(request.review_task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    now_ts = time.time()
+    _complete_task(task, request.decision, now_ts)
+    task["status"] = request.decision
+    task["reviewed_by"] = user["name"]
+    task["reviewer_notes"] = request.reviewer_notes
+    task["feedback"] = request.feedback_message or request.reviewer_notes
+    task["reviewer_confidence"] = request.reviewer_confidence
+    task["reviewed_at"] = iso_ts(now_ts)
+    task["reviewed_ts"] = now_ts
     
-    raise HTTPException(status_code=404, detail="Task not found")
+    return {
+        "task_id": request.review_task_id,
+        "decision": request.decision,
+        "status": "recorded",
+        "message": "Decision recorded and vendor notified"
+    }
 
 
 @app.get("/api/v1/review/stats")
 async def get_queue_statistics(user: Dict = Depends(require_official)):
     """Get review queue statistics"""
-    pending_count = len([t for t in review_tasks if t["status"] == "pending"])
-    completed = [t for t in review_tasks if t["status"] != "pending"]
-    
-    accepted = len([t for t in completed if t["status"] == "accepted"])
-    rejected = len([t for t in completed if t["status"] == "rejected"])
-    
-    now = datetime.now()
-    sla_violations = 0
-    for task in review_tasks:
-        if task["status"] == "pending":
-            due_by = datetime.fromisoformat(task["due_by"])
-            if now > due_by:
-                sla_violations += 1
-    
+    _flush_commit_log()
     avg_review_time = None
-    if completed:
-        times = []
-        for task in completed:
-            if task.get("reviewed_at"):
-                created = datetime.fromisoformat(task["created_at"])
-                reviewed = datetime.fromisoformat(task["reviewed_at"])
-                times.append((reviewed - created).total_seconds() / 60)
-        if times:
-            avg_review_time = sum(times) / len(times)
+    if n_reviewed:
+        avg_review_time = sum_review_seconds / n_reviewed / 60
     
     return {
-        "pending_count": pending_count,
-        "completed_count": len(completed),
-        "accepted_count": accepted,
-        "rejected_count": rejected,
-        "sla_violations": sla_violations,
+        "pending_count": len(pending_tasks),
+        "completed_count": len(completed_tasks),
+        "accepted_count": decision_counts["accepted"],
+        "rejected_count": decision_counts["rejected"],
+        "sla_violations": _count_sla_violations(time.time()),
         "avg_review_time_minutes": avg_review_time,
     }
 
@@ -438,11 +752,11 @@ async def health_check():
 @app.post("/api/v1/review/create-task")
 async def create_review_task_public(request: CreateReviewTaskRequest):
     """Create review task (public for testing)"""
-    global task_counter
-    task_counter += 1
+    now_ts = time.time()
+    task_id = next(_task_ids)
     
     task = {
-        "id": task_counter,
+        "id": task_id,
         "product_id": request.product_id,
         "product_image_id": request.product_image_id,
         "product_name": request.product_name,
@@ -457,16 +771,18 @@ async def create_review_task_public(request: CreateReviewTaskRequest):
         "priority": 3,
         "status": "pending",
         "feedback": None,
-        "created_at": datetime.now().isoformat(),
-        "due_by": (datetime.now() + timedelta(hours=48)).isoformat(),
+        "created_at": iso_ts(now_ts),
+        "created_ts": now_ts,
+        "due_by": iso_ts(now_ts + REVIEW_SLA_SECONDS),
+        "due_by_ts": now_ts + REVIEW_SLA_SECONDS,
     }
     
-    review_tasks.append(task)
+    _enqueue_commit(task)
     
     return {
-        "task_id": task_counter,
+        "task_id": task_id,
         "status": "created",
-        "message": f"Review task created: {task_counter}"
+        "message": f"Review task created: {task_id}"
     }
 
 
@@ -476,32 +792,62 @@ async def create_review_task_public(request: CreateReviewTaskRequest):
 
 @app.on_event("startup")
 async def startup():
-    global sku_generator, image_validator, review_queue
+    global sku_generator, image_validator, review_queue, _commit_consumer, _commit_ready
+    
+    # Banner lines are collected and written once at the end
+    banner = [
+        "\n" + "=" * 60,
+        "  Catalyze - Image Review Platform v2.0",
+        "  Product image review and approval workflow",
+        "=" * 60,
+    ]
     
-    print("\n" + "=" * 60)
-    print("  Catalyze - Image Review Platform v2.0")
-    print("  Product image review and approval workflow")
-    print("=" * 60)
+    if not config.AUTH_SECRET_KEY and not config.DEBUG:
+        logger.warning(
+            "AUTH_SECRET_KEY is not set; tokens are signed with a per-process random key "
+            "and will not verify on other workers or after a restart"
+        )
     
     sku_generator = SKUGenerator(db_connection=None)
-    print("✓ SKU generator initialized")
+    banner.append("✓ SKU generator initialized")
     
     image_validator = ImageValidator(
         background_white_threshold=config.BACKGROUND_WHITE_THRESHOLD,
         blur_threshold=config.BLUR_THRESHOLD,
+        working_max_side=config.IMAGE_WORKING_MAX_SIDE,
+        decode_scale=config.IMAGE_DECODE_SCALE,
+        min_image_side_px=config.IMAGE_MIN_SIDE_PX,
+        max_image_bytes=config.IMAGE_MAX_SIZE_MB * 1024 * 1024,
         object_coverage_min=config.OBJECT_COVERAGE_MIN,
         object_coverage_max=config.OBJECT_COVERAGE_MAX,
         accept_score_threshold=config.IMAGE_ACCEPT_THRESHOLD,
         review_score_threshold=config.IMAGE_HUMAN_REVIEW_THRESHOLD,
+        detector=load_detector(config.OBJECT_DETECTION_MODEL_PATH),
     )
-    print("✓ Image validator initialized")
+    banner.append("✓ Image validator initialized")
     
     review_queue = ReviewQueue(db_connection=None)
-    print("✓ Review queue initialized")
+    banner.append("✓ Review queue initialized")
+    
+    # Fresh event on the serving loop (an Event binds to the first loop that waits on it)
+    _commit_ready = asyncio.Event()
+    if not commit_queue.empty():
+        _commit_ready.set()
+    _commit_consumer = asyncio.create_task(_run_commit_log())
+    banner.append("✓ Commit log consumer started")
     
-    print(f"\n🚀 Catalyze ready at http://localhost:{config.API_PORT}")
-    print(f"📡 API docs: http://localhost:{config.API_PORT}/docs")
-    print("=" * 60 + "\n")
+    banner.append(f"\n🚀 Catalyze ready at http://localhost:{config.API_PORT}")
+    banner.append(f"📡 API docs: http://localhost:{config.API_PORT}/docs")
+    banner.append("=" * 60 + "\n")
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    if _commit_consumer is not None:
+        _commit_consumer.cancel()
+    _flush_commit_log()
 
 
 if __name__ == "__main__":
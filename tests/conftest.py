@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the pipeline tests.
+
+Services built here are session-scoped: with db_connection=None they keep
+no per-call state, so one instance can serve every test that only calls
+them. Tests that reconfigure a service build their own.
+
+Service modules are imported inside the fixtures: conftest loads for every
+run, and image_validator (OpenCV, numba warm-up) costs ~0.6s to import,
+which a run of only the SKU tests never needs.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sku_gen():
+    """SKU generator in mock mode (no database)"""
+    from backend.services.sku_generator import SKUGenerator
+    return SKUGenerator(db_connection=None)
+
+
+@pytest.fixture(scope="session")
+def image_validator():
+    """Image validator with default thresholds and weights"""
+    from backend.services.image_validator import ImageValidator
+    return ImageValidator()
+
+
+@pytest.fixture(scope="session")
+def review_queue():
+    """Review queue in mock mode (no database)"""
+    from backend.services.review_queue import ReviewQueue
+    return ReviewQueue(db_connection=None)
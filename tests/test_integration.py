@@ -2,16 +2,20 @@
 Integration tests for full SKU & Image validation pipeline
 """
 
+import asyncio
 import pytest
-from backend.services.sku_generator import SKUGenerator, SKUStatus
+import numpy as np
+from backend.services.sku_generator import SKUStatus
 from backend.services.image_validator import ImageValidator, ValidationStatus
-from backend.services.review_queue import ReviewQueue, ReviewDecision
+from backend.services.review_queue import ReviewDecision
+
+pytestmark = pytest.mark.xdist_group("integration")
 
 
 class TestEndToEndPipeline:
     """End-to-end integration tests"""
 
-    def test_product_ingest_with_sku_and_validation(self):
+    def test_product_ingest_with_sku_and_validation(self, sku_gen, image_validator, review_queue):
         """
         Full workflow:
         1. Receive product with code
@@ -19,10 +23,7 @@ class TestEndToEndPipeline:
         3. Generate/validate image
         4. Create human review task if needed
         """
-        # Step 1: Initialize
-        sku_gen = SKUGenerator(db_connection=None)
-        validator = ImageValidator()
-        queue = ReviewQueue(db_connection=None)
+        # Step 1: Initialize (sku_gen / image_validator / review_queue: session fixtures)
 
         # Step 2: Generate SKU for new product
         raw_code = "BRIT10G"
@@ -50,7 +51,7 @@ class TestEndToEndPipeline:
         assert validation_status == ValidationStatus.AUTO_ACCEPTED
         assert validation_score >= 0.85
 
-    def test_collision_resolution_workflow(self):
+    def test_collision_resolution_workflow(self, sku_gen):
         """
         Scenario: Two users submit similar codes
         User 1: BRIT10G
@@ -58,15 +59,13 @@ class TestEndToEndPipeline:
         
         Expected: Both get unique SKUs without collision
         """
-        gen = SKUGenerator(db_connection=None)
-
-        sku1, status1 = gen.generate_sku(
+        sku1, status1 = sku_gen.generate_sku(
             raw_code="BRIT10G",
             vendor_id=100,
             vendor_short="BRIT",
         )
 
-        sku2, status2 = gen.generate_sku(
+        sku2, status2 = sku_gen.generate_sku(
             raw_code="BRITC10G",
             vendor_id=100,
             vendor_short="BRIT",
@@ -80,7 +79,7 @@ class TestEndToEndPipeline:
         assert "BRIT10G" in sku1
         assert "BRITC10G" in sku2
 
-    def test_image_validation_to_human_review_workflow(self):
+    def test_image_validation_to_human_review_workflow(self, review_queue):
         """
         Scenario: Image fails validation and goes to human review
         1. Image has low validation score (0.72)
@@ -92,23 +91,17 @@ class TestEndToEndPipeline:
             accept_score_threshold=0.85,
             review_score_threshold=0.70,
         )
-        queue = ReviewQueue(db_connection=None)
 
         # Simulated validation result
         validation_score = 0.72
         
         # Determine status
-        if validation_score >= validator.accept_score_threshold:
-            status = ValidationStatus.AUTO_ACCEPTED
-        elif validation_score >= validator.review_score_threshold:
-            status = ValidationStatus.NEEDS_REVIEW
-        else:
-            status = ValidationStatus.AUTO_REJECTED
+        status = validator.classify(validation_score)
 
         assert status == ValidationStatus.NEEDS_REVIEW
 
         # Create review task
-        task_id = queue.create_review_task(
+        task_id = review_queue.create_review_task(
             product_id=123,
             product_image_id=1001,
             product_name="Test Product",
@@ -123,7 +116,7 @@ class TestEndToEndPipeline:
         assert task_id > 0
 
         # Reviewer submits decision
-        result = queue.submit_review_decision(
+        result = review_queue.submit_review_decision(
             review_task_id=task_id,
             decision=ReviewDecision.ACCEPTED,
             reviewer_id=42,
@@ -136,68 +129,106 @@ class TestEndToEndPipeline:
 class TestMultiVendorScenario:
     """Test multi-vendor product ingest"""
 
-    def test_multiple_vendors_same_code_no_collision(self):
+    def test_multiple_vendors_same_code_no_collision(self, sku_gen):
         """
         Multiple vendors submit "PRODUCT10" code
         Each should get unique SKU without collision
         """
-        gen = SKUGenerator(db_connection=None)
-
         vendors = [
             ("British Imports", "BRIT", 1),
             ("Acme Corp", "ACME", 2),
             ("Global Trade", "GLOB", 3),
         ]
 
-        skus_generated = {}
-        
-        for vendor_name, vendor_short, vendor_id in vendors:
-            sku, status = gen.generate_sku(
-                raw_code="PRODUCT10",
-                vendor_id=vendor_id,
-                vendor_short=vendor_short,
-            )
-            
-            assert sku not in skus_generated, f"SKU {sku} collision detected!"
-            skus_generated[sku] = vendor_name
+        # SKU -> vendor; a collision would collapse two keys into one
+        skus_generated = {
+            sku_gen.generate_sku(raw_code="PRODUCT10", vendor_id=vendor_id, vendor_short=vendor_short)[0]: vendor_name
+            for vendor_name, vendor_short, vendor_id in vendors
+        }
 
         # All SKUs should be unique
-        assert len(skus_generated) == len(vendors)
+        assert len(skus_generated) == len(vendors), "SKU collision detected!"
         
         # Each should have correct vendor prefix
-        assert "BRIT-" in list(skus_generated.keys())[0]
-        print(f"Generated unique SKUs for {len(vendors)} vendors: {list(skus_generated.keys())}")
+        assert "BRIT-" in next(iter(skus_generated))
 
 
 class TestImageValidationThresholds:
     """Test different validation score thresholds"""
 
-    def test_threshold_configurations(self):
+    @pytest.mark.parametrize("accept,review,expected", [
+        (0.90, 0.75, ["auto_rejected", "auto_rejected", "needs_review", "needs_review", "auto_accepted"]),  # Strict
+        (0.85, 0.70, ["auto_rejected", "needs_review", "needs_review", "auto_accepted", "auto_accepted"]),  # Moderate (default)
+        (0.75, 0.60, ["needs_review", "needs_review", "auto_accepted", "auto_accepted", "auto_accepted"]),  # Lenient
+    ])
+    def test_threshold_configurations(self, accept, review, expected):
         """Test different threshold configurations"""
-        configs = [
-            {"accept": 0.90, "review": 0.75},  # Strict
-            {"accept": 0.85, "review": 0.70},  # Moderate (default)
-            {"accept": 0.75, "review": 0.60},  # Lenient
-        ]
+        validator = ImageValidator(accept_score_threshold=accept, review_score_threshold=review)
+        test_scores = np.array([0.65, 0.72, 0.78, 0.88, 0.95])
+
+        # All scores classified in one vectorized call
+        statuses = [status.value for status in validator.classify_batch(test_scores)]
+        assert statuses == expected
+
+
+class TestQueueStatsCache:
+    """Stale-while-revalidate cache behind the review stats endpoint"""
+
+    def test_failed_refresh_keeps_stale_body(self, monkeypatch):
+        """A stats query failure ({} from the queue) must not replace the cached body"""
+        from backend import main
+
+        queue = main.get_review_queue()
+        monkeypatch.setattr(queue, "get_queue_stats", lambda: {"pending_count": 3})
+        cache = main._StaleWhileRevalidateCache(main._load_queue_stats, ttl_seconds=0)
+
+        async def scenario():
+            body = await cache.get()
+            monkeypatch.setattr(queue, "get_queue_stats", lambda: {})
+            assert await cache.get() == body  # stale body while the refresh runs
+            await cache._refresh_task
+            assert await cache.get() == body  # failed refresh kept it
+            return body
+
+        assert asyncio.run(scenario()) == b'{"pending_count":3}'
+        with pytest.raises(RuntimeError):
+            main._load_queue_stats()
+
+
+class TestImageDownload:
+    """Streaming image download used by the validate endpoint"""
+
+    @staticmethod
+    def _client(body):
+        import httpx
+        return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+
+    def test_download_writes_body_to_file(self, tmp_path):
+        from backend import main
+
+        body = bytes(range(256)) * 4096  # spans several chunks
+        dest = tmp_path / "image.jpg"
+
+        async def scenario():
+            async with self._client(body) as client:
+                return await main._download_image(client, "http://images.test/a.jpg", str(dest))
+
+        assert asyncio.run(scenario()) == len(body)
+        assert dest.read_bytes() == body
 
-        test_scores = [0.65, 0.72, 0.78, 0.88, 0.95]
+    def test_download_over_limit_is_rejected(self, tmp_path, monkeypatch):
+        from fastapi import HTTPException
+        from backend import main
 
-        for config in configs:
-            validator = ImageValidator(
-                accept_score_threshold=config["accept"],
-                review_score_threshold=config["review"],
-            )
+        monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1000)
 
-            print(f"\nConfiguration: accept={config['accept']}, review={config['review']}")
-            for score in test_scores:
-                if score >= validator.accept_score_threshold:
-                    status = ValidationStatus.AUTO_ACCEPTED
-                elif score >= validator.review_score_threshold:
-                    status = ValidationStatus.NEEDS_REVIEW
-                else:
-                    status = ValidationStatus.AUTO_REJECTED
+        async def scenario():
+            async with self._client(b"x" * 5000) as client:
+                await main._download_image(client, "http://images.test/a.jpg", str(tmp_path / "big.jpg"))
 
-                print(f"  Score {score:.2f}: {status.value}")
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(scenario())
+        assert excinfo.value.status_code == 413
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+"""
+Tests for Review Queue (Problem 3)
+
+Covers:
+- Task due-date helpers (overdue filtering, bulk stats)
+- Reviewer rotation for auto-assignment
+- Claiming the next task
+"""
+
+import itertools
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from backend.services.review_queue import (
+    ReviewQueue,
+    ReviewStatus,
+    ReviewTask,
+    RoundRobinDispatcher,
+    filter_overdue,
+)
+
+
+pytestmark = pytest.mark.xdist_group("review_queue")
+
+NOW = datetime(2026, 1, 15, 12, 0)
+
+
+def _task(task_id, due_in_days):
+    """Pending task due `due_in_days` after NOW (negative = overdue)"""
+    return ReviewTask(
+        id=task_id,
+        task_uuid=uuid.uuid4(),
+        product_id=task_id,
+        product_image_id=task_id,
+        product_name="Widget",
+        vendor_code="WID10",
+        canonical_sku="VEND-WID10",
+        image_url="https://images.example.com/widget.jpg",
+        validation_score=0.75,
+        validation_checks={},
+        failure_reason="Borderline score",
+        status=ReviewStatus.PENDING,
+        created_at=NOW - timedelta(days=1),
+        due_by=NOW + timedelta(days=due_in_days),
+    )
+
+
+class _ClaimConnection:
+    """Stand-in DB connection: the claim UPDATE returns `row` (or raises `error`)"""
+
+    def __init__(self, row=None, error=None):
+        self.row = row
+        self.error = error
+        self.executed = []
+        self.committed = self.rolled_back = False
+
+    def cursor(self):
+        return _ClaimCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class _ClaimCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.connection.error:
+            raise self.connection.error
+        self.connection.executed.append((sql, params))
+
+    def fetchone(self):
+        return self.connection.row
+
+
+class TestTaskDueDates:
+    """Overdue filtering and bulk due-date statistics"""
+
+    def test_filter_overdue_keeps_input_order(self):
+        tasks = [_task(1, -2), _task(2, 3), _task(3, -0.5), _task(4, 1)]
+        assert [t.id for t in filter_overdue(tasks, now=NOW)] == [1, 3]
+
+    def test_filter_overdue_due_now_is_not_overdue(self):
+        assert filter_overdue([_task(1, 0)], now=NOW) == []
+
+    def test_bulk_stats(self):
+        tasks = [_task(1, -2), _task(2, 3), _task(3, 2)]
+        stats = ReviewTask.bulk_stats(tasks, now=NOW)
+        assert stats["overdue_count"] == 1
+        assert stats["avg_days_to_due"] == pytest.approx(1.0)
+
+    def test_bulk_stats_matches_per_task_helpers(self):
+        tasks = [_task(i, d) for i, d in enumerate((-3.5, -0.25, 0.5, 4, 10))]
+        stats = ReviewTask.bulk_stats(tasks, now=NOW)
+        assert stats["overdue_count"] == sum(t.is_overdue(NOW) for t in tasks)
+        assert stats["avg_days_to_due"] == pytest.approx(sum(t.days_to_due(NOW) for t in tasks) / len(tasks))
+
+    def test_bulk_stats_empty(self):
+        assert ReviewTask.bulk_stats([], now=NOW) == {"overdue_count": 0, "avg_days_to_due": 0.0}
+
+
+class TestRoundRobinDispatcher:
+    """Reviewer rotation for task auto-assignment"""
+
+    def test_rotation_order(self):
+        """Reviewers are handed out in roster order, wrapping around"""
+        dispatcher = RoundRobinDispatcher(lambda: [1, 2, 3])
+        assert [dispatcher.next_reviewer() for _ in range(7)] == [1, 2, 3, 1, 2, 3, 1]
+
+    def test_no_reviewers(self):
+        dispatcher = RoundRobinDispatcher(lambda: [])
+        assert dispatcher.next_reviewer() is None
+
+    def test_refresh_picks_up_new_reviewer(self):
+        """A reviewer added to the roster joins the rotation on the next refresh"""
+        roster = [1, 2]
+        dispatcher = RoundRobinDispatcher(lambda: list(roster), refresh_secs=0)
+        assert [dispatcher.next_reviewer() for _ in range(2)] == [1, 2]
+        roster.append(3)
+        assert [dispatcher.next_reviewer() for _ in range(3)] == [1, 2, 3]
+
+    def test_unchanged_roster_keeps_position(self):
+        dispatcher = RoundRobinDispatcher(lambda: [1, 2, 3], refresh_secs=0)
+        assert [dispatcher.next_reviewer() for _ in range(4)] == [1, 2, 3, 1]
+
+    def test_custom_strategy(self):
+        """Strategy decides the order, e.g. reverse round-robin"""
+        dispatcher = RoundRobinDispatcher(lambda: [1, 2, 3], strategy=lambda ids: itertools.cycle(ids[::-1]))
+        assert [dispatcher.next_reviewer() for _ in range(4)] == [3, 2, 1, 3]
+
+    def test_auto_assign_uses_configured_roster(self):
+        """A reviewer with no decision history still gets work"""
+        queue = ReviewQueue(db_connection=None, reviewer_ids=[7, 5, 7])
+        assert queue.get_reviewer_ids() == [5, 7]
+        dispatcher = RoundRobinDispatcher(queue.get_reviewer_ids)
+        assert [queue.auto_assign_task(task_id, dispatcher) for task_id in (1, 2, 3)] == [5, 7, 5]
+
+
+class TestClaimNextTask:
+    """Atomic claim of the most urgent unassigned task"""
+
+    def test_no_database(self, review_queue):
+        assert review_queue.claim_next_task(reviewer_id=7) is None
+
+    def test_claims_returned_task(self):
+        connection = _ClaimConnection(row=(42,))
+        queue = ReviewQueue(db_connection=None)
+        queue.db = connection  # skip the psycopg2 UUID adapter registration
+
+        assert queue.claim_next_task(reviewer_id=7, priority_filter=1) == 42
+        (sql, params), = connection.executed
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert params == {"reviewer_id": 7, "priority": 1}
+        assert connection.committed
+
+    def test_nothing_pending(self):
+        queue = ReviewQueue(db_connection=None)
+        queue.db = _ClaimConnection(row=None)
+        assert queue.claim_next_task(reviewer_id=7) is None
+
+    def test_database_error_rolls_back(self):
+        connection = _ClaimConnection(error=RuntimeError("connection lost"))
+        queue = ReviewQueue(db_connection=None)
+        queue.db = connection
+        assert queue.claim_next_task(reviewer_id=7) is None
+        assert connection.rolled_back and not connection.committed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,294 @@
+"""
+Tests for the demo server (run_server.py)
+
+Covers:
+- Auth (scrypt hashing, login cache, JWT issue/revoke)
+- Review decisions and queue statistics
+- Write-behind commit log (visibility to readers, shutdown flush)
+- Vendor uploads (dedup of identical bytes, size limit, preallocated writes)
+"""
+
+import io
+import os
+import time
+from itertools import count
+
+import pytest
+from fastapi.testclient import TestClient
+
+import run_server
+
+
+pytestmark = pytest.mark.xdist_group("server")
+
+_emails = count(1)
+
+
+def _login(client, role):
+    """Register a fresh user with the given role; return its auth headers"""
+    email = f"{role}{next(_emails)}@example.com"
+    client.post("/api/v1/auth/register", json={"name": role.title(), "email": email, "password": "pw", "role": role})
+    token = client.post("/api/v1/auth/login", json={"email": email, "password": "pw"}).json()["token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_task(client):
+    """Create a review task through the public endpoint; return its id"""
+    response = client.post("/api/v1/review/create-task", json={
+        "product_id": 1,
+        "product_image_id": 1,
+        "product_name": "Widget",
+        "vendor_code": "WID10",
+        "canonical_sku": "WID1-WID10",
+        "image_url": "/uploads/widget.jpg",
+        "validation_score": 0.75,
+        "validation_checks": {},
+        "failure_reason": "Borderline score",
+    })
+    assert response.status_code == 200
+    return response.json()["task_id"]
+
+
+@pytest.fixture(scope="class")
+def client():
+    """Client with startup/shutdown events run (starts the commit log consumer)"""
+    with TestClient(run_server.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="class")
+def official(client):
+    """Auth headers for a review official"""
+    return _login(client, "official")
+
+
+@pytest.fixture(scope="class")
+def vendor(client):
+    """Auth headers for a vendor"""
+    return _login(client, "vendor")
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """Store uploads under tmp_path for the test"""
+    monkeypatch.setattr(run_server, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestAuth:
+    """Register / login / logout and the token lifecycle"""
+
+    def _register(self, client, password="secret"):
+        email = f"auth{next(_emails)}@example.com"
+        response = client.post("/api/v1/auth/register", json={
+            "name": "Auth", "email": email, "password": password, "role": "vendor",
+        })
+        assert response.status_code == 200
+        return email
+
+    def test_hash_password_salts_and_verifies(self):
+        """Fresh salts give different hashes; the same salt reproduces one"""
+        first = run_server.hash_password("secret")
+        second = run_server.hash_password("secret")
+        assert first["salt"] != second["salt"]
+        assert first["hash"] != second["hash"]
+        assert run_server.hash_password("secret", first["salt"])["hash"] == first["hash"]
+
+    def test_register_login_me_logout(self, client):
+        """A token works for /me until logout, then returns 401"""
+        email = self._register(client)
+        response = client.post("/api/v1/auth/login", json={"email": email, "password": "secret"})
+        assert response.status_code == 200
+        headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        me = client.get("/api/v1/auth/me", headers=headers)
+        assert me.status_code == 200
+        assert me.json()["email"] == email
+
+        assert client.post("/api/v1/auth/logout", headers=headers).status_code == 200
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+    def test_wrong_password_rejected(self, client):
+        """A wrong password is 401, even with a cached successful login"""
+        email = self._register(client)
+        assert client.post("/api/v1/auth/login", json={"email": email, "password": "secret"}).status_code == 200
+        response = client.post("/api/v1/auth/login", json={"email": email, "password": "wrong"})
+        assert response.status_code == 401
+
+    def test_unknown_email_rejected(self, client):
+        response = client.post("/api/v1/auth/login", json={"email": "nobody@example.com", "password": "secret"})
+        assert response.status_code == 401
+
+    def test_repeat_login_uses_cache(self, client, monkeypatch):
+        """The second login skips the KDF; logout drops the cached check"""
+        email = self._register(client)
+        login = {"email": email, "password": "secret"}
+        token = client.post("/api/v1/auth/login", json=login).json()["token"]
+        assert email in run_server._verified_logins
+
+        def fail(*args, **kwargs):
+            raise AssertionError("KDF ran for a cached login")
+
+        monkeypatch.setattr(run_server, "hash_password", fail)
+        assert client.post("/api/v1/auth/login", json=login).status_code == 200
+
+        client.post("/api/v1/auth/logout", headers={"Authorization": f"Bearer {token}"})
+        assert email not in run_server._verified_logins
+
+    def test_revoked_token_does_not_decode(self):
+        token = run_server.generate_token("someone@example.com")
+        payload = run_server.decode_token(token)
+        assert payload["sub"] == "someone@example.com"
+        run_server.revoke_token(payload)
+        assert run_server.decode_token(token) is None
+
+    def test_invalid_token_rejected(self, client):
+        response = client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-token"})
+        assert response.status_code == 401
+
+
+class TestReviewDecisions:
+    """Decisions on review tasks"""
+
+    def _decide(self, client, official, task_id, decision):
+        return client.post("/api/v1/review/submit-decision", headers=official, json={
+            "review_task_id": task_id, "decision": decision, "reviewer_id": 1,
+        })
+
+    def test_non_terminal_decision_is_rejected(self, client, official):
+        """A "pending" decision is invalid and leaves the task pending"""
+        task_id = _create_task(client)
+        assert self._decide(client, official, task_id, "pending").status_code == 422
+        assert client.get(f"/api/v1/review/task/{task_id}", headers=official).json()["status"] == "pending"
+
+        # The task can still be decided normally afterwards
+        assert self._decide(client, official, task_id, "accepted").status_code == 200
+        assert task_id not in {t["id"] for t in run_server.pending_tasks}
+
+    def test_redecision_replaces_previous(self, client, official):
+        """Re-deciding a completed task moves its count to the new decision"""
+        before = client.get("/api/v1/review/stats", headers=official).json()
+        task_id = _create_task(client)
+        self._decide(client, official, task_id, "accepted")
+        assert self._decide(client, official, task_id, "rejected").status_code == 200
+
+        after = client.get("/api/v1/review/stats", headers=official).json()
+        assert after["accepted_count"] == before["accepted_count"]
+        assert after["rejected_count"] == before["rejected_count"] + 1
+
+    def test_task_responses_hide_bookkeeping(self, client, official, vendor, upload_dir):
+        """Epoch timestamps and stored filenames stay off the reviewer API"""
+        client.post(
+            "/api/v1/images/upload",
+            headers=vendor,
+            files={"file": ("photo.jpg", io.BytesIO(b"view-test"), "image/jpeg")},
+            data={"product_name": "Widget", "vendor_code": "wid10"},
+        )
+        task_id = _create_task(client)
+        self._decide(client, official, task_id, "accepted")
+
+        internal = {"created_ts", "due_by_ts", "reviewed_ts", "filename"}
+        pending = client.get("/api/v1/review/pending", headers=official).json()["tasks"]
+        assert pending and all(internal.isdisjoint(task) for task in pending)
+
+        task = client.get(f"/api/v1/review/task/{task_id}", headers=official).json()
+        assert internal.isdisjoint(task)
+        assert task["status"] == "accepted"
+        assert task["reviewed_at"] is not None
+
+
+class TestCommitLog:
+    """Write-behind commit log behind task creation"""
+
+    def test_created_task_visible_to_readers(self, client, official):
+        """Readers flush first, so a task shows up right after it is created"""
+        before = client.get("/api/v1/review/stats", headers=official).json()["pending_count"]
+        task_id = _create_task(client)
+
+        pending = client.get("/api/v1/review/pending", headers=official).json()
+        assert task_id in {t["id"] for t in pending["tasks"]}
+        assert client.get("/api/v1/review/stats", headers=official).json()["pending_count"] == before + 1
+
+    def test_consumer_applies_batch_without_reader(self, client):
+        """The background consumer applies queued records on its own"""
+        task_id = _create_task(client)
+        deadline = time.monotonic() + 2.0
+        while task_id not in run_server.records and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert task_id in run_server.records
+
+    def test_shutdown_flushes_queued_records(self, monkeypatch):
+        """Records still queued when the server stops are applied, not dropped"""
+        monkeypatch.setattr(run_server, "COMMIT_BATCH_WINDOW_SECS", 60.0)
+        with TestClient(run_server.app) as c:
+            task_id = _create_task(c)
+            assert task_id not in run_server.records  # still waiting for the batch window
+        assert task_id in run_server.records
+        assert run_server.commit_queue.empty()
+
+
+class TestUploads:
+    """Vendor image uploads"""
+
+    def _upload(self, client, vendor, body, content_type="image/jpeg"):
+        return client.post(
+            "/api/v1/images/upload",
+            headers=vendor,
+            files={"file": ("photo.jpg", body, content_type)},
+            data={"product_name": "Widget", "vendor_code": "wid10"},
+        )
+
+    def _image_url(self, client, vendor, submission_id):
+        submissions = client.get("/api/v1/images/my-submissions", headers=vendor).json()["submissions"]
+        return next(s["image_url"] for s in submissions if s["id"] == submission_id)
+
+    def test_identical_bytes_reuse_stored_file(self, client, vendor, upload_dir):
+        """A byte-identical re-upload is a new submission pointing at the same file"""
+        body = os.urandom(3000)
+        first = self._upload(client, vendor, body).json()["submission_id"]
+        second = self._upload(client, vendor, body).json()["submission_id"]
+
+        assert first != second
+        assert self._image_url(client, vendor, first) == self._image_url(client, vendor, second)
+        assert [p.read_bytes() for p in upload_dir.iterdir()] == [body]
+
+    def test_different_bytes_stored_separately(self, client, vendor, upload_dir):
+        self._upload(client, vendor, os.urandom(100))
+        self._upload(client, vendor, os.urandom(100))
+        assert len(list(upload_dir.iterdir())) == 2
+
+    def test_oversized_upload_rejected(self, client, vendor, upload_dir, monkeypatch):
+        monkeypatch.setattr(run_server, "MAX_UPLOAD_BYTES", 1000)
+        response = self._upload(client, vendor, os.urandom(5000))
+        assert response.status_code == 413
+        assert list(upload_dir.iterdir()) == []
+
+    def test_unsupported_type_rejected(self, client, vendor, upload_dir):
+        assert self._upload(client, vendor, b"GIF89a", content_type="image/gif").status_code == 400
+
+
+class TestSaveUpload:
+    """Chunked, preallocated upload writes"""
+
+    def test_size_hint_larger_than_stream_is_truncated(self, tmp_path):
+        """Preallocation the stream didn't fill is released"""
+        path = tmp_path / "upload.jpg"
+        body = os.urandom(5000)
+        written = run_server._save_upload(io.BytesIO(body), str(path), max_bytes=1 << 20, size_hint=64 * 1024)
+        assert written == len(body)
+        assert path.read_bytes() == body
+
+    def test_multi_chunk_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(run_server, "UPLOAD_CHUNK_BYTES", 1024)
+        path = tmp_path / "upload.jpg"
+        body = os.urandom(10_000)
+        assert run_server._save_upload(io.BytesIO(body), str(path), max_bytes=1 << 20, size_hint=len(body)) == len(body)
+        assert path.read_bytes() == body
+
+    def test_stream_over_limit_removes_partial_file(self, tmp_path, monkeypatch):
+        """A stream longer than its declared size is still capped"""
+        monkeypatch.setattr(run_server, "UPLOAD_CHUNK_BYTES", 1024)
+        path = tmp_path / "upload.jpg"
+        with pytest.raises(ValueError):
+            run_server._save_upload(io.BytesIO(os.urandom(5000)), str(path), max_bytes=2048, size_hint=1000)
+        assert not path.exists()